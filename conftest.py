@@ -6,6 +6,13 @@ from movie_translator.ffmpeg import get_ffmpeg
 from movie_translator.types import DialogueLine
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory, monkeypatch):
+    # Keep every on-disk cache (OCR output, translations) out of the user's
+    # home and separate per test. Cache tests rely on starting empty.
+    monkeypatch.setenv('MOVIE_TRANSLATOR_CACHE_DIR', str(tmp_path_factory.mktemp('cache')))
+
+
 @pytest.fixture
 def tmp_output_dir(tmp_path):
     output_dir = tmp_path / 'output'
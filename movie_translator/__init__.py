@@ -3,7 +3,6 @@ __author__ = 'Movie Translator Team'
 
 from .logging import logger
 from .main import main
-from .pipeline import TranslationPipeline
 from .types import DialogueLine, SubtitleFile
 
 __all__ = [
@@ -13,3 +12,13 @@ __all__ = [
     'logger',
     'main',
 ]
+
+
+def __getattr__(name: str):
+    # The pipeline pulls in torch/transformers; load it on first access so the
+    # CLI entry point (and --help) doesn't pay for it up front.
+    if name == 'TranslationPipeline':
+        from .pipeline import TranslationPipeline
+
+        return TranslationPipeline
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -168,12 +168,14 @@ async def process_file(
         translate_stage: TranslateStage = stages['translate']  # ty: ignore[invalid-assignment]
         translate_stage.set_tracker(tracker)
 
-        # Detect character names for translation protection
+        # Detect character names for translation protection. This is a regex
+        # pass over every line, so keep it off the event loop where it would
+        # stall the other files' stages.
         from movie_translator.translation.proper_nouns import extract_proper_nouns_from_subtitles
 
         assert ctx.dialogue_lines is not None
-        proper_nouns = extract_proper_nouns_from_subtitles(
-            [line.text for line in ctx.dialogue_lines]
+        proper_nouns = await asyncio.to_thread(
+            extract_proper_nouns_from_subtitles, [line.text for line in ctx.dialogue_lines]
         )
 
         async def _check_fonts():
@@ -0,0 +1,31 @@
+"""Location of the on-disk caches (OCR output, translations).
+
+Everything lives under $MOVIE_TRANSLATOR_CACHE_DIR, falling back to
+$XDG_CACHE_HOME/movie_translator or ~/.cache/movie_translator, with one
+subdirectory per kind of cached data. ``--no-cache`` turns all of them off
+for the current process via disable().
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+_enabled = True
+
+
+def disable() -> None:
+    """Bypass every on-disk cache for the rest of this process."""
+    global _enabled
+    _enabled = False
+
+
+def cache_dir(kind: str) -> Path | None:
+    """Directory for cached *kind* data, or None when caching is disabled."""
+    if not _enabled:
+        return None
+    override = os.environ.get('MOVIE_TRANSLATOR_CACHE_DIR')
+    if override:
+        return Path(override) / kind
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'movie_translator' / kind
@@ -3,6 +3,7 @@
 import sys
 from pathlib import Path
 
+from ..cache import disable as disable_cache
 from ..logging import console, set_verbose
 
 
@@ -24,6 +25,11 @@ def parse_args(argv: list[str]):
         default='pl',
         help='Language hint for burned-in subtitle OCR (default: pl)',
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not update the on-disk OCR cache',
+    )
     parser.add_argument('--verbose', '-v', action='store_true')
     return parser.parse_args(argv)
 
@@ -32,6 +38,8 @@ def run(argv: list[str]) -> None:
     """Entry point for the extract subcommand."""
     args = parse_args(argv)
     set_verbose(args.verbose)
+    if args.no_cache:
+        disable_cache()
 
     input_path = Path(args.input)
     if not input_path.exists():
@@ -4,8 +4,11 @@ import asyncio
 import logging
 import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
+from ..cache import disable as disable_cache
 from ..context import PipelineConfig
 from ..discovery import create_work_dir, find_videos
 from ..ffmpeg import get_video_info
@@ -13,10 +16,6 @@ from ..logging import console, logger, set_verbose
 from ..metrics.collector import MetricsCollector, NullCollector
 from ..metrics.listeners import ReportBuilder
 from ..metrics.report import build_report, save_report
-from ..pipeline import TranslationPipeline
-from ..progress import ProgressTracker
-from ..subtitles import SubtitleExtractor
-from ..translation import ModelCache
 from .common import check_dependencies, resolve_model
 
 
@@ -58,15 +57,24 @@ def parse_args(argv: list[str] | None = None):
         default=None,
         help='Directory with pre-extracted subtitles (from extract command) to add as additional tracks',
     )
+    parser.add_argument(
+        '--sidecar-subs',
+        action='store_true',
+        help='Write subtitles next to the video instead of remuxing it (no font embedding)',
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore and do not update the on-disk OCR and translation caches',
+    )
     parser.add_argument('--verbose', '-v', action='store_true')
     parser.add_argument('--metrics', action='store_true', help='Collect performance metrics')
     return parser.parse_args(argv)
 
 
 def _show_summary(results: list[tuple[str, str]], dry_run: bool = False) -> None:
-    successful = sum(1 for _, status in results if status == 'success')
-    failed = sum(1 for _, status in results if status == 'failed')
-    skipped = sum(1 for _, status in results if status == 'skipped')
+    counts = Counter(status for _, status in results)
+    successful, failed, skipped = counts['success'], counts['failed'], counts['skipped']
 
     parts = []
     if successful > 0:
@@ -84,6 +92,10 @@ def _show_summary(results: list[tuple[str, str]], dry_run: bool = False) -> None
 
 def _sync_main(video_files, root_dir, args, collector, report_builder):
     """Run the pipeline sequentially for each video file (workers == 1)."""
+    from ..pipeline import TranslationPipeline
+    from ..progress import ProgressTracker
+    from ..subtitles import SubtitleExtractor
+
     extractor = SubtitleExtractor()
 
     with ProgressTracker(len(video_files), console=console) as tracker:
@@ -96,90 +108,109 @@ def _sync_main(video_files, root_dir, args, collector, report_builder):
             tracker=tracker,
             metrics=collector,
             external_subs_dir=Path(args.external_subs) if args.external_subs else None,
+            sidecar_subs=args.sidecar_subs,
         )
 
-        for video_path in video_files:
-            relative_name = (
-                str(video_path.relative_to(root_dir))
-                if root_dir != video_path.parent
-                else video_path.name
-            )
-            tracker.start_file(relative_name)
-            work_dir = create_work_dir(video_path, root_dir)
-            success = False
-
-            if report_builder is not None:
-                report_builder.start_video(
-                    path=str(video_path),
-                    hash='',
-                    file_size_bytes=video_path.stat().st_size if video_path.exists() else 0,
-                    duration_ms=0,
-                    identity={},
+        # Probe the next file in the background while this one is processed,
+        # so its ffprobe round-trip is already memoized when it comes up.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='probe') as prefetch:
+            probe = None
+            for index, video_path in enumerate(video_files):
+                if probe is not None:
+                    # lru_cache doesn't merge concurrent calls; let this
+                    # file's background probe finish rather than run a second.
+                    wait([probe])
+                probe = None
+                if index + 1 < len(video_files):
+                    probe = prefetch.submit(get_video_info, video_files[index + 1])
+                _process_one(
+                    video_path, root_dir, args, pipeline, extractor, tracker, report_builder
                 )
 
+
+def _process_one(video_path, root_dir, args, pipeline, extractor, tracker, report_builder):
+    """Run the pipeline on one file of a sequential batch and record the outcome."""
+    relative_name = (
+        str(video_path.relative_to(root_dir)) if root_dir != video_path.parent else video_path.name
+    )
+    tracker.start_file(relative_name)
+    work_dir = create_work_dir(video_path, root_dir)
+    success = False
+
+    if report_builder is not None:
+        report_builder.start_video(
+            path=str(video_path),
+            hash='',
+            file_size_bytes=video_path.stat().st_size if video_path.exists() else 0,
+            duration_ms=0,
+            identity={},
+        )
+
+    try:
+        if extractor.has_polish_subtitles(video_path):
+            tracker.complete_file('skipped')
+            success = True
+        elif pipeline.process_video_file(video_path, work_dir, dry_run=args.dry_run):
+            tracker.complete_file('success')
+            success = True
+        else:
+            tracker.complete_file('failed')
+    except Exception as e:
+        logger.error(f'Unexpected error: {e}')
+        tracker.complete_file('failed')
+
+    if report_builder is not None:
+        identity = getattr(pipeline, 'last_identity', None)
+        if identity is not None:
+            identity_dict = {
+                'title': identity.title,
+                'parsed_title': identity.parsed_title,
+                'media_type': identity.media_type,
+                'season': identity.season,
+                'episode': identity.episode,
+                'year': identity.year,
+                'is_anime': identity.is_anime,
+                'release_group': identity.release_group,
+                'imdb_id': identity.imdb_id,
+                'tmdb_id': identity.tmdb_id,
+            }
+            video_duration_ms = 0
             try:
-                if extractor.has_polish_subtitles(video_path):
-                    tracker.complete_file('skipped')
-                    success = True
-                elif pipeline.process_video_file(video_path, work_dir, dry_run=args.dry_run):
-                    tracker.complete_file('success')
-                    success = True
+                info = get_video_info(video_path)
+                duration_s = float(info.get('format', {}).get('duration', 0))
+                video_duration_ms = int(duration_s * 1000)
+            except Exception:
+                pass
+            report_builder.update_current_video(
+                identity=identity_dict,
+                hash=identity.oshash,
+                duration_ms=video_duration_ms,
+            )
+        report_builder.end_video()
+
+    if success and not args.keep_artifacts and work_dir.exists():
+        try:
+            shutil.rmtree(work_dir)
+            parent = work_dir.parent
+            temp_root = root_dir / '.translate_temp'
+            while parent != temp_root and parent != root_dir:
+                if parent.exists() and not any(parent.iterdir()):
+                    parent.rmdir()
+                    parent = parent.parent
                 else:
-                    tracker.complete_file('failed')
-            except Exception as e:
-                logger.error(f'Unexpected error: {e}')
-                tracker.complete_file('failed')
-
-            if report_builder is not None:
-                identity = getattr(pipeline, 'last_identity', None)
-                if identity is not None:
-                    identity_dict = {
-                        'title': identity.title,
-                        'parsed_title': identity.parsed_title,
-                        'media_type': identity.media_type,
-                        'season': identity.season,
-                        'episode': identity.episode,
-                        'year': identity.year,
-                        'is_anime': identity.is_anime,
-                        'release_group': identity.release_group,
-                        'imdb_id': identity.imdb_id,
-                        'tmdb_id': identity.tmdb_id,
-                    }
-                    video_duration_ms = 0
-                    try:
-                        info = get_video_info(video_path)
-                        duration_s = float(info.get('format', {}).get('duration', 0))
-                        video_duration_ms = int(duration_s * 1000)
-                    except Exception:
-                        pass
-                    report_builder.update_current_video(
-                        identity=identity_dict,
-                        hash=identity.oshash,
-                        duration_ms=video_duration_ms,
-                    )
-                report_builder.end_video()
-
-            if success and not args.keep_artifacts and work_dir.exists():
-                try:
-                    shutil.rmtree(work_dir)
-                    parent = work_dir.parent
-                    temp_root = root_dir / '.translate_temp'
-                    while parent != temp_root and parent != root_dir:
-                        if parent.exists() and not any(parent.iterdir()):
-                            parent.rmdir()
-                            parent = parent.parent
-                        else:
-                            break
-                    if temp_root.exists() and not any(temp_root.iterdir()):
-                        temp_root.rmdir()
-                except OSError as e:
-                    logger.debug(f'Failed to clean up {work_dir}: {e}')
+                    break
+            if temp_root.exists() and not any(temp_root.iterdir()):
+                temp_root.rmdir()
+        except OSError as e:
+            logger.debug(f'Failed to clean up {work_dir}: {e}')
 
 
 async def _async_main(video_files, root_dir, args, collector, report_builder, workers):
     """Run the pipeline concurrently via async orchestration."""
     from ..async_pipeline import run_all
     from ..gpu_queue import GpuQueue
+    from ..progress import ProgressTracker
+    from ..translation import ModelCache
 
     config = PipelineConfig(
         device=args.device,
@@ -190,6 +221,7 @@ async def _async_main(video_files, root_dir, args, collector, report_builder, wo
         dry_run=args.dry_run,
         workers=workers,
         external_subs_dir=Path(args.external_subs) if args.external_subs else None,
+        sidecar_subs=args.sidecar_subs,
         model_cache=ModelCache(),
     )
 
@@ -217,6 +249,8 @@ def run(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
     set_verbose(args.verbose)
     args.model = resolve_model(args.model)
+    if args.no_cache:
+        disable_cache()
 
     input_path = Path(args.input)
     if not input_path.exists():
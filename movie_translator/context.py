@@ -28,6 +28,7 @@ class PipelineConfig:
     dry_run: bool = False
     workers: int = 4
     external_subs_dir: Path | None = None
+    sidecar_subs: bool = False
     model_cache: ModelCache | None = None
 
 
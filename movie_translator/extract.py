@@ -8,7 +8,8 @@ from .identifier import identify_media
 from .identifier.types import MediaIdentity
 from .logging import console, logger
 from .ocr.burned_in_extractor import extract_burned_in_subtitles
-from .subtitles import SubtitleExtractor
+from .subtitles import SubtitleExtractor, is_image_track
+from .subtitles._pysubs2 import get_pysubs2, load_subs
 
 
 def _build_output_stem(identity: MediaIdentity) -> str:
@@ -61,15 +62,15 @@ def _extract_text_tracks(
         'pl': 'pl',
     }
 
+    planned: dict[Path, tuple[dict, str, str]] = {}
     for track in tracks:
         props = track.get('properties', {})
         lang = (props.get('language') or '').lower()
         if lang not in lang_map:
             continue
 
-        codec = track.get('codec', '').lower()
         # Skip image-based tracks — those need OCR, handled separately
-        if any(codec == c or codec.startswith(c) for c in SubtitleExtractor.IMAGE_CODECS):
+        if is_image_track(track):
             continue
 
         # Skip signs/songs
@@ -80,42 +81,61 @@ def _extract_text_tracks(
         out_lang = lang_map[lang]
         ext = extractor.get_subtitle_extension(track)
         out_file = f'{output_stem}.{out_lang}{ext}'
-        out_path = output_dir / out_file
+        # Keep the first track per output name; a later one would overwrite it
+        planned.setdefault(output_dir / out_file, (track, out_lang, out_file))
 
-        try:
-            extractor.extract_subtitle(
-                video_path,
-                track['id'],
-                out_path,
-                subtitle_index=track.get('subtitle_index'),
-            )
-            line_count = _count_subtitle_lines(out_path)
-            results.append(
-                {
-                    'file': out_file,
-                    'language': out_lang,
-                    'method': 'embedded_text',
-                    'line_count': line_count,
-                }
-            )
-            logger.info(f'Extracted {out_lang} text track: {out_file} ({line_count} lines)')
-        except Exception as e:
-            logger.warning(f'Failed to extract track {track["id"]}: {e}')
+    if not planned:
+        return results
+
+    # One ffmpeg pass for every track; fall back to per-track extraction so a
+    # single bad stream doesn't lose the others.
+    extracted: list[tuple[dict, str, str]] = []
+    try:
+        extractor.extract_subtitles(
+            video_path,
+            [(track.get('subtitle_index') or 0, path) for path, (track, _, _) in planned.items()],
+        )
+        extracted = list(planned.values())
+    except Exception as e:
+        logger.debug(f'Batch extraction failed, extracting tracks one by one: {e}')
+        for out_path, (track, out_lang, out_file) in planned.items():
+            try:
+                extractor.extract_subtitle(
+                    video_path,
+                    track['id'],
+                    out_path,
+                    subtitle_index=track.get('subtitle_index'),
+                )
+                extracted.append((track, out_lang, out_file))
+            except Exception as e:
+                logger.warning(f'Failed to extract track {track["id"]}: {e}')
+
+    for _track, out_lang, out_file in extracted:
+        line_count = _count_subtitle_lines(output_dir / out_file)
+        results.append(
+            {
+                'file': out_file,
+                'language': out_lang,
+                'method': 'embedded_text',
+                'line_count': line_count,
+            }
+        )
+        logger.info(f'Extracted {out_lang} text track: {out_file} ({line_count} lines)')
 
     return results
 
 
 def _count_subtitle_lines(path: Path) -> int:
     """Count dialogue lines in a subtitle file."""
-    try:
-        import pysubs2
-
-        subs = pysubs2.load(str(path))
-        return len([e for e in subs.events if e.type == 'Dialogue'])
-    except Exception:
-        # Fallback: count SRT blocks
-        text = path.read_text(encoding='utf-8', errors='replace')
-        return text.count(' --> ')
+    if get_pysubs2() is not None:
+        try:
+            subs = load_subs(path)
+            return sum(1 for e in subs.events if e.type == 'Dialogue')
+        except Exception:
+            pass
+    # Fallback: count SRT blocks
+    text = path.read_text(encoding='utf-8', errors='replace')
+    return text.count(' --> ')
 
 
 def _extract_ocr(
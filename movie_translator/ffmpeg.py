@@ -10,11 +10,23 @@ import static_ffmpeg.run
 
 from .types import SubtitleFile
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class VideoMuxError(Exception):
     pass
 
 
+# Fixed ffprobe arguments for the JSON stream/format probe; only the
+# binary and the input path vary between calls.
+_FFPROBE_JSON_ARGS = ('-v', 'quiet', '-print_format', 'json', '-show_streams', '-show_format')
+
+
 @lru_cache(maxsize=1)
 def get_ffmpeg_paths() -> tuple[str, str]:
     # Prefer system FFmpeg found on PATH or well-known locations
@@ -55,23 +67,29 @@ def get_ffprobe() -> str:
     return get_ffmpeg_paths()[1]
 
 
-@lru_cache(maxsize=128)
 def get_video_info(video_path: Path) -> dict[str, Any]:
+    """Return ffprobe's stream/format info, memoized per file version.
+
+    A file is probed several times per run (Polish-track check, both extract
+    stages, OCR setup). The memo key includes mtime and size, so a video that
+    has been replaced at the same path (after muxing) is probed afresh.
+    """
+    try:
+        st = os.stat(video_path)
+        version = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        version = None
+    return _probe_video_info(os.fspath(video_path), version)
+
+
+@lru_cache(maxsize=128)
+def _probe_video_info(path: str, version: tuple[int, int] | None) -> dict[str, Any]:
     ffprobe = get_ffprobe()
 
-    cmd = [
-        ffprobe,
-        '-v',
-        'quiet',
-        '-print_format',
-        'json',
-        '-show_streams',
-        '-show_format',
-        str(video_path),
-    ]
+    cmd = [ffprobe, *_FFPROBE_JSON_ARGS, path]
 
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    return json.loads(result.stdout)
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return _json_loads(result.stdout)
 
 
 def probe_video_encoding(video_path: Path) -> dict[str, Any]:
@@ -156,14 +174,11 @@ def _resolve_mkvmerge_sub_track_id(
     subtitle_index: int,
 ) -> int:
     """Convert a subtitle-relative index to the mkvmerge absolute track ID."""
-    result = subprocess.run(
-        [mkvmerge, '-J', str(video_path)],
-        capture_output=True,
-        text=True,
-    )
+    result = subprocess.run([mkvmerge, '-J', str(video_path)], capture_output=True)
     if result.returncode != 0:
-        raise VideoMuxError(f'mkvmerge identify failed: {result.stderr}')
-    info = json.loads(result.stdout)
+        stderr = result.stderr.decode(errors='replace')
+        raise VideoMuxError(f'mkvmerge identify failed: {stderr}')
+    info = _json_loads(result.stdout)
     sub_tracks = [t for t in info.get('tracks', []) if t['type'] == 'subtitles']
     if subtitle_index >= len(sub_tracks):
         raise VideoMuxError(
@@ -183,7 +198,9 @@ def _mux_with_mkvmerge(
     original_sub_title: str | None = None,
 ) -> None:
     """Mux using mkvmerge — properly interleaves subtitle packets with video data."""
-    cmd = [mkvmerge, '-o', str(output_path)]
+    # --quiet drops the progress output; warnings and errors are still
+    # printed (on stdout) and are all we read back.
+    cmd = [mkvmerge, '--quiet', '-o', str(output_path)]
 
     if original_sub_index is not None:
         track_id = _resolve_mkvmerge_sub_track_id(mkvmerge, video_path, original_sub_index)
@@ -227,6 +244,7 @@ def _mux_with_ffmpeg(
     cmd = [
         ffmpeg,
         '-y',
+        '-nostats',
         '-i',
         str(video_path),
     ]
@@ -284,7 +302,8 @@ def _mux_with_ffmpeg(
 
     cmd.append(str(output_path))
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Only stderr is consulted (on failure); ffmpeg writes nothing useful to stdout.
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
     if result.returncode != 0:
         error_lines = [line for line in result.stderr.split('\n') if 'error' in line.lower()]
         error_msg = '; '.join(error_lines) if error_lines else 'Unknown ffmpeg error'
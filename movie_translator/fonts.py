@@ -1,10 +1,9 @@
-import json
 import platform
 import subprocess
 import tempfile
 from pathlib import Path
 
-from .ffmpeg import get_ffmpeg, get_ffprobe
+from .ffmpeg import get_ffmpeg, get_video_info
 from .logging import logger
 from .types import POLISH_CHARS
 
@@ -21,19 +20,9 @@ _PREFERRED_FALLBACK_FONTS = [
 
 
 def get_embedded_fonts(video_path: Path) -> list[dict]:
-    ffprobe = get_ffprobe()
-    cmd = [
-        ffprobe,
-        '-v',
-        'quiet',
-        '-print_format',
-        'json',
-        '-show_streams',
-        str(video_path),
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    data = json.loads(result.stdout)
+    # Attachments are listed as streams, so the (memoized) probe from track
+    # selection already has them.
+    data = get_video_info(video_path)
 
     fonts = []
     for stream in data.get('streams', []):
@@ -65,7 +54,7 @@ def extract_font(video_path: Path, stream_index: int, output_path: Path) -> bool
         '-i',
         str(video_path),
     ]
-    subprocess.run(cmd, capture_output=True, text=True)
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return output_path.exists()
 
 
@@ -83,14 +72,13 @@ def font_supports_polish(font_path: Path) -> bool:
 
 
 def get_ass_font_names(ass_path: Path) -> set[str]:
-    from .subtitles._pysubs2 import get_pysubs2
+    from .subtitles._pysubs2 import get_pysubs2, load_subs
 
-    pysubs2 = get_pysubs2()
-    if pysubs2 is None:
+    if get_pysubs2() is None:
         return set()
 
     try:
-        subs = pysubs2.load(str(ass_path))
+        subs = load_subs(ass_path)
         font_names = set()
         for style in subs.styles.values():
             if hasattr(style, 'fontname') and style.fontname:
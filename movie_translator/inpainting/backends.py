@@ -6,7 +6,8 @@ All frame-level backends share the same interface: inpaint(image, mask) -> image
 
 from __future__ import annotations
 
-from typing import Protocol, runtime_checkable
+import threading
+from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 from PIL import Image
@@ -55,20 +56,36 @@ def _load_simple_lama(device):
     return instance
 
 
+# Loaded LaMa models keyed by requested device. The weights are a few hundred
+# MB, so every LamaBackend in the process shares one instance per device
+# instead of reloading them for each file.
+_LAMA_MODELS: dict[str, Any] = {}
+_LAMA_LOCK = threading.Lock()
+
+
+def _get_shared_lama(device: str):
+    """Return the process-wide LaMa model for *device*, loading it on first use."""
+    with _LAMA_LOCK:
+        model = _LAMA_MODELS.get(device)
+        if model is None:
+            import torch
+
+            from ..logging import logger
+
+            try:
+                model = _load_simple_lama(torch.device(device))
+            except Exception:
+                logger.warning(f'LaMa failed to load on {device}, falling back to CPU')
+                model = _load_simple_lama(torch.device('cpu'))
+            _LAMA_MODELS[device] = model
+        return model
+
+
 class LamaBackend:
     """LaMa neural network inpainting. Highest quality, slowest."""
 
     def __init__(self, device: str = 'cpu'):
-        import torch
-
-        from ..logging import logger
-
-        torch_device = torch.device(device)
-        try:
-            self._model = _load_simple_lama(torch_device)
-        except Exception:
-            logger.warning(f'LaMa failed to load on {device}, falling back to CPU')
-            self._model = _load_simple_lama(torch.device('cpu'))
+        self._model = _get_shared_lama(device)
 
     def inpaint(self, image: Image.Image, mask: Image.Image) -> Image.Image:
         return self._model(image, mask.convert('L'))
@@ -1,10 +1,26 @@
+from unittest.mock import MagicMock, patch
+
 import numpy as np
 import pytest
 from PIL import Image
 
+from movie_translator.inpainting import backends
 from movie_translator.inpainting.inpainter import Inpainter
 
 
+class TestSharedModel:
+    def test_model_loaded_once_per_device(self):
+        with (
+            patch.dict(backends._LAMA_MODELS, clear=True),
+            patch.object(backends, '_load_simple_lama', return_value=MagicMock()) as load,
+        ):
+            first = Inpainter(device='cpu')
+            second = Inpainter(device='cpu')
+
+        assert load.call_count == 1
+        assert first._model is second._model
+
+
 @pytest.mark.slow
 class TestInpainter:
     def test_inpaints_masked_region(self):
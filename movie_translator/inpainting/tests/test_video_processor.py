@@ -1,4 +1,5 @@
 import subprocess
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -8,12 +9,36 @@ from movie_translator.inpainting.video_processor import (
     _build_subtitle_lookup,
     _compute_crop_region,
     _detect_scene_cut,
+    _link_or_copy,
     _remap_boxes_to_crop,
     remove_burned_in_subtitles,
 )
 from movie_translator.types import BoundingBox, OCRResult
 
 
+class TestLinkOrCopy:
+    def test_hardlinks_when_possible(self, tmp_path):
+        src = tmp_path / 'in.mkv'
+        src.write_bytes(b'video')
+        dst = tmp_path / 'out.mkv'
+
+        _link_or_copy(src, dst)
+
+        assert dst.stat().st_ino == src.stat().st_ino
+
+    def test_copies_without_hardlinks(self, tmp_path):
+        src = tmp_path / 'in.mkv'
+        src.write_bytes(b'video')
+        dst = tmp_path / 'out.mkv'
+        dst.write_bytes(b'stale')
+
+        with patch('movie_translator.inpainting.video_processor.os.link', side_effect=OSError):
+            _link_or_copy(src, dst)
+
+        assert dst.read_bytes() == b'video'
+        assert dst.stat().st_ino != src.stat().st_ino
+
+
 class TestBuildSubtitleLookup:
     def test_maps_ocr_result_to_frame_range(self):
         box = BoundingBox(x=0.1, y=0.8, width=0.8, height=0.1)
@@ -1,3 +1,4 @@
+import os
 import queue
 import shutil
 import subprocess
@@ -290,6 +291,19 @@ def _make_temporal_hybrid_processor(
     return process
 
 
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Make *dst* have *src*'s content without rewriting it when possible.
+
+    The output is only ever read (as mux input), so a hardlink is enough.
+    copyfile uses the kernel's zero-copy path (sendfile/fcopyfile) otherwise.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 def remove_burned_in_subtitles(
     video_path: Path,
     output_path: Path,
@@ -319,8 +333,8 @@ def remove_burned_in_subtitles(
 
     subtitle_lookup = _build_subtitle_lookup(ocr_results, fps)
     if not subtitle_lookup:
-        logger.warning('No subtitle frames to inpaint — copying original')
-        shutil.copy2(video_path, output_path)
+        logger.warning('No subtitle frames to inpaint — reusing original')
+        _link_or_copy(video_path, output_path)
         return
 
     total_subtitle_frames = len(subtitle_lookup)
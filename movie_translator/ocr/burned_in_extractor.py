@@ -1,4 +1,6 @@
+import os
 import shutil
+import tempfile
 from pathlib import Path
 
 import numpy as np
@@ -6,8 +8,9 @@ from PIL import Image
 
 from ..logging import logger
 from ..types import BoundingBox, BurnedInResult, DialogueLine, OCRResult
+from . import cache as ocr_cache
 from .frame_extractor import extract_subtitle_region_frames
-from .vision_ocr import recognize_text_with_boxes
+from .vision_ocr import map_ocr, recognize_text_with_boxes
 
 # ── Configurable constants ───────────────────────────────────────────────────
 OCR_EXTRACT_FPS = 3
@@ -15,6 +18,8 @@ OCR_SCALE_WIDTH = 1280  # it is 720p as - 1280w x720h
 OCR_CROP_RATIO = 0.25  # bottom 25% of frame
 OCR_CHANGE_THRESHOLD = 15.0  # mean absolute pixel diff to detect a change
 OCR_VARIANCE_THRESHOLD = 200.0  # pixel variance threshold for "has text"
+RAM_SCRATCH_DIR = Path('/dev/shm')
+RAM_SCRATCH_MIN_FREE = 2 * 1024**3  # frames for a feature film are a few hundred MB
 
 
 def _map_box_to_full_frame(box: BoundingBox, crop_ratio: float) -> BoundingBox:
@@ -107,6 +112,23 @@ def _write_srt(lines: list[DialogueLine], output_path: Path) -> None:
     output_path.write_text('\n'.join(parts), encoding='utf-8')
 
 
+def _frames_scratch_dir(output_dir: Path) -> Path:
+    """Create a directory for the extracted frames, in RAM when available.
+
+    Thousands of JPEGs are written, read once and deleted, so there's no
+    point sending them to the (possibly network) disk holding the video.
+    Falls back to the work dir when /dev/shm is missing or short on space.
+    """
+    try:
+        if os.access(RAM_SCRATCH_DIR, os.W_OK) and (
+            shutil.disk_usage(RAM_SCRATCH_DIR).free >= RAM_SCRATCH_MIN_FREE
+        ):
+            return Path(tempfile.mkdtemp(prefix='mt_ocr_frames_', dir=RAM_SCRATCH_DIR))
+    except OSError:
+        pass
+    return output_dir / '_ocr_frames'
+
+
 def extract_burned_in_subtitles(
     video_path: Path,
     output_dir: Path,
@@ -119,7 +141,13 @@ def extract_burned_in_subtitles(
     Uses change detection to OCR only frames where subtitle text changed,
     and scales frames to 720p width for efficiency.
     """
-    frames_dir = output_dir / '_ocr_frames'
+    srt_path = output_dir / f'{video_path.stem}_ocr.srt'
+    cache_variant = f'burned_in:{crop_ratio}:{fps}:{language}:{OCR_SCALE_WIDTH}'
+    cached_results = ocr_cache.load_ocr_results(video_path, cache_variant)
+    if cached_results is not None and ocr_cache.load_srt(video_path, cache_variant, srt_path):
+        return BurnedInResult(srt_path, cached_results)
+
+    frames_dir = _frames_scratch_dir(output_dir)
 
     try:
         frames = extract_subtitle_region_frames(
@@ -146,8 +174,13 @@ def extract_burned_in_subtitles(
         frame_texts: list[tuple[int, str]] = []
         ocr_results: list[OCRResult] = []
 
-        for i, (frame_path, timestamp_ms) in enumerate(transition_frames):
-            text_boxes = recognize_text_with_boxes(frame_path, language=language)
+        recognized = map_ocr(
+            lambda frame_path: recognize_text_with_boxes(frame_path, language=language),
+            [frame_path for frame_path, _ts in transition_frames],
+        )
+        for i, ((_frame_path, timestamp_ms), text_boxes) in enumerate(
+            zip(transition_frames, recognized, strict=True)
+        ):
             text = '\n'.join(t for t, _ in text_boxes).strip()
             frame_texts.append((timestamp_ms, text))
 
@@ -165,8 +198,9 @@ def extract_burned_in_subtitles(
 
         logger.info(f'Extracted {len(lines)} subtitle lines via OCR')
 
-        srt_path = output_dir / f'{video_path.stem}_ocr.srt'
         _write_srt(lines, srt_path)
+        ocr_cache.store_srt(video_path, cache_variant, srt_path)
+        ocr_cache.store_ocr_results(video_path, cache_variant, ocr_results)
 
         return BurnedInResult(srt_path, ocr_results)
 
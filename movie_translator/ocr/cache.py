@@ -0,0 +1,95 @@
+"""On-disk cache for OCR output.
+
+OCR of a full PGS track or a burned-in video takes minutes, while the result
+only depends on the video file and the OCR parameters. Entries are keyed by
+the video's resolved path, size and mtime plus a variant string describing
+the parameters, so a re-run on an unchanged file (e.g. after tweaking the
+translation) reuses the previous OCR output. Any change to the file misses.
+
+Entries live in the ``ocr`` subdirectory of the shared cache root (see
+movie_translator.cache). Cache failures are never fatal — they only cost a
+re-run of OCR.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from ..cache import cache_dir
+from ..logging import logger
+from ..types import BoundingBox, OCRResult
+
+
+def _entry_dir(video_path: Path, variant: str) -> Path | None:
+    root = cache_dir('ocr')
+    if root is None:
+        return None
+    try:
+        st = video_path.stat()
+    except OSError:
+        return None
+    key = f'{video_path.resolve()}|{st.st_size}|{st.st_mtime_ns}|{variant}'
+    return root / hashlib.sha1(key.encode()).hexdigest()
+
+
+def load_srt(video_path: Path, variant: str, dest: Path) -> bool:
+    """Copy a cached SRT for this video/variant to *dest*. Returns True on a hit."""
+    entry = _entry_dir(video_path, variant)
+    if entry is None:
+        return False
+    cached = entry / 'subtitles.srt'
+    if not cached.is_file():
+        return False
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, dest)
+    except OSError as e:
+        logger.debug(f'OCR cache read failed: {e}')
+        return False
+    logger.info(f'Reusing cached OCR result for {video_path.name}')
+    return True
+
+
+def store_srt(video_path: Path, variant: str, srt_path: Path) -> None:
+    """Save an OCR-produced SRT for later runs."""
+    entry = _entry_dir(video_path, variant)
+    if entry is None:
+        return
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        tmp = entry / 'subtitles.srt.tmp'
+        shutil.copyfile(srt_path, tmp)
+        os.replace(tmp, entry / 'subtitles.srt')
+    except OSError as e:
+        logger.debug(f'OCR cache write failed: {e}')
+
+
+def load_ocr_results(video_path: Path, variant: str) -> list[OCRResult] | None:
+    """Return cached per-frame OCR results (text + boxes), or None on a miss."""
+    entry = _entry_dir(video_path, variant)
+    if entry is None:
+        return None
+    path = entry / 'ocr_results.json'
+    try:
+        raw = json.loads(path.read_text(encoding='utf-8'))
+    except OSError, ValueError:
+        return None
+    return [OCRResult(ts, text, [BoundingBox(*box) for box in boxes]) for ts, text, boxes in raw]
+
+
+def store_ocr_results(video_path: Path, variant: str, results: list[OCRResult]) -> None:
+    """Save per-frame OCR results alongside the SRT."""
+    entry = _entry_dir(video_path, variant)
+    if entry is None:
+        return
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        tmp = entry / 'ocr_results.json.tmp'
+        tmp.write_text(json.dumps([list(r) for r in results]), encoding='utf-8')
+        os.replace(tmp, entry / 'ocr_results.json')
+    except OSError as e:
+        logger.debug(f'OCR cache write failed: {e}')
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import struct
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +24,9 @@ import numpy as np
 
 from ..logging import logger
 from ..types import BoundingBox, DialogueLine, OCRResult
+from . import cache as ocr_cache
 from .vision_ocr import is_available as is_ocr_available
+from .vision_ocr import map_ocr
 
 _VISION_AVAILABLE = False
 Quartz: Any = None
@@ -64,46 +67,48 @@ def _parse_segments(data: bytes) -> list[dict]:
 
 
 def _decode_rle(data: bytes, width: int, height: int) -> np.ndarray:
-    """Decode PGS RLE-encoded bitmap into a palette-indexed array."""
-    pixels = []
+    """Decode PGS RLE-encoded bitmap into a palette-indexed array.
+
+    Runs are written as slice fills into a preallocated, zeroed buffer, so
+    zero runs and end-of-line padding only move the write position.
+    """
     total = width * height
+    out = bytearray(total)
+    pos = 0
     i = 0
-    while i < len(data) and len(pixels) < total:
+    n = len(data)
+    while i < n and pos < total:
         byte = data[i]
         i += 1
         if byte != 0:
-            pixels.append(byte)
-        else:
-            if i >= len(data):
-                break
-            flag = data[i]
+            out[pos] = byte
+            pos += 1
+            continue
+        if i >= n:
+            break
+        flag = data[i]
+        i += 1
+        kind = flag & 0xC0
+        if flag == 0:
+            # End of line — skip to the next width boundary
+            pos = min(-(-pos // width) * width, total)
+        elif kind == 0x40:
+            pos += ((flag & 0x3F) << 8) | data[i]
             i += 1
-            if flag == 0:
-                # End of line — pad to width boundary
-                while len(pixels) % width != 0 and len(pixels) < total:
-                    pixels.append(0)
-            elif flag & 0xC0 == 0x40:
-                length = ((flag & 0x3F) << 8) | data[i]
-                i += 1
-                pixels.extend([0] * length)
-            elif flag & 0xC0 == 0x80:
-                length = flag & 0x3F
-                color = data[i]
-                i += 1
-                pixels.extend([color] * length)
-            elif flag & 0xC0 == 0xC0:
-                length = ((flag & 0x3F) << 8) | data[i]
-                i += 1
-                color = data[i]
-                i += 1
-                pixels.extend([color] * length)
-            else:
-                length = flag & 0x3F
-                pixels.extend([0] * length)
+        elif kind == 0x80:
+            end = min(pos + (flag & 0x3F), total)
+            out[pos:end] = bytes((data[i],)) * (end - pos)
+            i += 1
+            pos = end
+        elif kind == 0xC0:
+            end = min(pos + (((flag & 0x3F) << 8) | data[i]), total)
+            out[pos:end] = bytes((data[i + 1],)) * (end - pos)
+            i += 2
+            pos = end
+        else:
+            pos += flag & 0x3F
 
-    if len(pixels) < total:
-        pixels.extend([0] * (total - len(pixels)))
-    return np.array(pixels[:total], dtype=np.uint8).reshape((height, width))
+    return np.frombuffer(out, dtype=np.uint8).reshape((height, width))
 
 
 # ---------------------------------------------------------------------------
@@ -111,20 +116,21 @@ def _decode_rle(data: bytes, width: int, height: int) -> np.ndarray:
 # ---------------------------------------------------------------------------
 
 
-def _extract_subtitle_images(
+def _iter_subtitle_images(
     segments: list[dict],
-) -> list[tuple[float, np.ndarray, int, int]]:
-    """Extract subtitle bitmap images from parsed PGS segments.
+) -> Iterator[tuple[float, np.ndarray, int, int]]:
+    """Decode subtitle bitmap images from parsed PGS segments, one at a time.
 
-    Returns list of (pts_ms, grayscale_image, width, height) tuples.
-    Only returns events that contain actual subtitle content (skips clear events).
+    Yields (pts_ms, grayscale_image, width, height) tuples. Only yields events
+    that contain actual subtitle content (skips clear events). Decoding lazily
+    lets OCR start on the first images while later ones are still being
+    decoded, and keeps only a few bitmaps in memory at once.
     """
     # Lookup tables for palette → grayscale conversion (256 entries max).
     # Updated incrementally as PDS segments arrive.
     y_lut = np.zeros(256, dtype=np.uint8)
     a_lut = np.zeros(256, dtype=np.uint8)
 
-    results = []
     ods_data = b''
     ods_width = 0
     ods_height = 0
@@ -166,9 +172,7 @@ def _extract_subtitle_images(
                     gray = y_lut[indexed]
                     alpha = a_lut[indexed]
                     img = np.where(alpha > 128, gray, 0).astype(np.uint8)
-                    results.append((current_pts, img, ods_width, ods_height))
-
-    return results
+                    yield current_pts, img, ods_width, ods_height
 
 
 # ---------------------------------------------------------------------------
@@ -219,6 +223,13 @@ def _ocr_grayscale_image(img: np.ndarray) -> tuple[str, list[BoundingBox]]:
     return '\n'.join(texts).strip(), boxes
 
 
+def _ocr_subtitle_image(
+    image: tuple[float, np.ndarray, int, int],
+) -> tuple[float, str, list[BoundingBox]]:
+    pts_ms, img, _width, _height = image
+    return (pts_ms, *_ocr_grayscale_image(img))
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -243,6 +254,11 @@ def extract_pgs_track(
     Returns:
         Path to the generated .srt file, or None if extraction failed.
     """
+    srt_path = work_dir / f'{video_path.stem}_pgs_ocr.srt'
+    cache_variant = f'pgs:{track_index}'
+    if ocr_cache.load_srt(video_path, cache_variant, srt_path):
+        return srt_path
+
     if not is_ocr_available():
         logger.warning('PGS extraction requires macOS with Vision framework')
         return None
@@ -268,23 +284,21 @@ def extract_pgs_track(
     logger.info('Parsing PGS subtitle stream...')
     data = sup_path.read_bytes()
     segments = _parse_segments(data)
-    images = _extract_subtitle_images(segments)
-
-    if not images:
-        logger.warning('No subtitle images found in PGS track')
-        return None
 
-    logger.info(f'Found {len(images)} subtitle images, running OCR...')
+    logger.info('Running OCR on PGS subtitle images...')
 
-    # Step 3: OCR each image (in-memory, no disk I/O)
+    # Step 3: Decode and OCR each image (in-memory, no disk I/O). Images are
+    # decoded on demand while earlier ones are being recognized.
     ocr_results: list[OCRResult] = []
     dialogue_lines: list[DialogueLine] = []
     prev_text = ''
     line_start_ms = 0
+    image_count = 0
+    last_pts = 0.0
 
-    for i, (pts_ms, img, _width, _height) in enumerate(images):
-        text, boxes = _ocr_grayscale_image(img)
-
+    for pts_ms, text, boxes in map_ocr(_ocr_subtitle_image, _iter_subtitle_images(segments)):
+        image_count += 1
+        last_pts = pts_ms
         if text and boxes:
             ocr_results.append(OCRResult(timestamp_ms=int(pts_ms), text=text, boxes=boxes))
 
@@ -310,12 +324,15 @@ def extract_pgs_track(
             )
             prev_text = ''
 
-        if (i + 1) % 100 == 0:
-            logger.info(f'OCR progress: {i + 1}/{len(images)}')
+        if image_count % 100 == 0:
+            logger.info(f'OCR progress: {image_count} images')
+
+    if not image_count:
+        logger.warning('No subtitle images found in PGS track')
+        return None
 
     # Close final line
     if prev_text:
-        last_pts = images[-1][0]
         dialogue_lines.append(
             DialogueLine(
                 start_ms=int(line_start_ms),
@@ -331,8 +348,8 @@ def extract_pgs_track(
     logger.info(f'Extracted {len(dialogue_lines)} dialogue lines from PGS track')
 
     # Step 4: Write SRT
-    srt_path = work_dir / f'{video_path.stem}_pgs_ocr.srt'
     _write_srt(dialogue_lines, srt_path)
+    ocr_cache.store_srt(video_path, cache_variant, srt_path)
 
     # Clean up
     sup_path.unlink(missing_ok=True)
@@ -1,4 +1,10 @@
-from movie_translator.ocr.burned_in_extractor import _build_dialogue_lines_from_ocr, _write_srt
+from unittest.mock import patch
+
+from movie_translator.ocr.burned_in_extractor import (
+    _build_dialogue_lines_from_ocr,
+    _frames_scratch_dir,
+    _write_srt,
+)
 from movie_translator.types import BoundingBox, DialogueLine
 
 
@@ -138,3 +144,26 @@ class TestWriteSrt:
         assert '2\n' in content
         assert '00:00:04,000 --> 00:00:06,500' in content
         assert 'Second line' in content
+
+
+class TestFramesScratchDir:
+    def test_uses_ram_disk_when_available(self, tmp_path):
+        shm = tmp_path / 'shm'
+        shm.mkdir()
+
+        with (
+            patch('movie_translator.ocr.burned_in_extractor.RAM_SCRATCH_DIR', shm),
+            patch('movie_translator.ocr.burned_in_extractor.RAM_SCRATCH_MIN_FREE', 0),
+        ):
+            frames_dir = _frames_scratch_dir(tmp_path / 'work')
+
+        assert frames_dir.parent == shm
+        assert frames_dir.is_dir()
+
+    def test_falls_back_to_work_dir(self, tmp_path):
+        with patch(
+            'movie_translator.ocr.burned_in_extractor.RAM_SCRATCH_DIR', tmp_path / 'missing'
+        ):
+            frames_dir = _frames_scratch_dir(tmp_path / 'work')
+
+        assert frames_dir == tmp_path / 'work' / '_ocr_frames'
@@ -0,0 +1,78 @@
+import os
+from unittest.mock import patch
+
+from movie_translator.ocr import cache
+from movie_translator.ocr.pgs_extractor import extract_pgs_track
+from movie_translator.types import BoundingBox, OCRResult
+
+
+def _video(tmp_path):
+    video = tmp_path / 'ep01.mkv'
+    video.write_bytes(b'video data')
+    return video
+
+
+class TestSrtCache:
+    def test_round_trip(self, tmp_path):
+        video = _video(tmp_path)
+        srt = tmp_path / 'out.srt'
+        srt.write_text('1\n00:00:01,000 --> 00:00:02,000\nHello\n')
+
+        cache.store_srt(video, 'pgs:2', srt)
+        dest = tmp_path / 'work' / 'restored.srt'
+
+        assert cache.load_srt(video, 'pgs:2', dest)
+        assert dest.read_text() == srt.read_text()
+
+    def test_miss_for_other_variant(self, tmp_path):
+        video = _video(tmp_path)
+        srt = tmp_path / 'out.srt'
+        srt.write_text('x')
+        cache.store_srt(video, 'pgs:2', srt)
+
+        assert not cache.load_srt(video, 'pgs:3', tmp_path / 'dest.srt')
+
+    def test_modified_video_misses(self, tmp_path):
+        video = _video(tmp_path)
+        srt = tmp_path / 'out.srt'
+        srt.write_text('x')
+        cache.store_srt(video, 'pgs:2', srt)
+
+        st = video.stat()
+        os.utime(video, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert not cache.load_srt(video, 'pgs:2', tmp_path / 'dest.srt')
+
+    def test_missing_video_misses(self, tmp_path):
+        assert not cache.load_srt(tmp_path / 'nope.mkv', 'pgs:2', tmp_path / 'dest.srt')
+
+
+class TestOcrResultsCache:
+    def test_round_trip(self, tmp_path):
+        video = _video(tmp_path)
+        results = [
+            OCRResult(1000, 'Hello', [BoundingBox(0.1, 0.8, 0.5, 0.1)]),
+            OCRResult(2000, '', []),
+        ]
+
+        cache.store_ocr_results(video, 'burned_in', results)
+
+        assert cache.load_ocr_results(video, 'burned_in') == results
+
+    def test_miss_returns_none(self, tmp_path):
+        assert cache.load_ocr_results(_video(tmp_path), 'burned_in') is None
+
+
+class TestPgsUsesCache:
+    def test_cache_hit_skips_extraction(self, tmp_path):
+        video = _video(tmp_path)
+        srt = tmp_path / 'cached.srt'
+        srt.write_text('1\n00:00:01,000 --> 00:00:02,000\nCached\n')
+        cache.store_srt(video, 'pgs:2', srt)
+
+        with patch('movie_translator.ocr.pgs_extractor.subprocess.run') as mock_run:
+            result = extract_pgs_track(video, 2, tmp_path / 'work')
+
+        mock_run.assert_not_called()
+        assert result is not None
+        assert 'Cached' in result.read_text()
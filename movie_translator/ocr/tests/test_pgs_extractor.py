@@ -7,12 +7,13 @@ import pytest
 
 from movie_translator.ocr.pgs_extractor import (
     _decode_rle,
-    _extract_subtitle_images,
     _format_srt_time,
+    _iter_subtitle_images,
     _parse_segments,
     _write_srt,
     extract_pgs_track,
 )
+from movie_translator.ocr.vision_ocr import map_ocr
 from movie_translator.types import BoundingBox, DialogueLine
 
 # ---------------------------------------------------------------------------
@@ -297,6 +298,14 @@ class TestDecodeRle:
         # Rest should be zero-padded
         assert np.sum(img) == 7
 
+    def test_run_past_end_is_clipped(self):
+        # A colour run longer than the bitmap must not spill past width * height
+        data = bytes([0, 0x85, 0x09])
+        img = _decode_rle(data, 2, 1)
+
+        assert img.shape == (1, 2)
+        np.testing.assert_array_equal(img[0], [9, 9])
+
     def test_empty_data(self):
         img = _decode_rle(b'', 2, 2)
 
@@ -305,7 +314,7 @@ class TestDecodeRle:
 
 
 # ---------------------------------------------------------------------------
-# _extract_subtitle_images
+# _iter_subtitle_images
 # ---------------------------------------------------------------------------
 
 
@@ -355,7 +364,7 @@ class TestExtractSubtitleImages:
         rle_data = bytes([1, 1, 0, 0])
         ods = {'pts': 100.0, 'type': _SEG_ODS, 'data': self._make_ods_data(2, 1, rle_data)}
 
-        results = _extract_subtitle_images([pcs, pds, ods])
+        results = list(_iter_subtitle_images([pcs, pds, ods]))
 
         assert len(results) == 1
         pts, img, w, h = results[0]
@@ -370,7 +379,7 @@ class TestExtractSubtitleImages:
         # PCS with num_objects=0 is a clear event
         pcs_clear = {'pts': 50.0, 'type': _SEG_PCS, 'data': self._make_pcs_data(0)}
 
-        results = _extract_subtitle_images([pcs_clear])
+        results = list(_iter_subtitle_images([pcs_clear]))
 
         assert len(results) == 0
 
@@ -385,7 +394,7 @@ class TestExtractSubtitleImages:
         rle_data = bytes([1, 0, 0])  # one pixel index 1, pad to width 2
         ods = {'pts': 100.0, 'type': _SEG_ODS, 'data': self._make_ods_data(2, 1, rle_data)}
 
-        results = _extract_subtitle_images([pcs, pds, ods])
+        results = list(_iter_subtitle_images([pcs, pds, ods]))
 
         assert len(results) == 1
         _, img, _, _ = results[0]
@@ -407,14 +416,14 @@ class TestExtractSubtitleImages:
         rle2 = bytes([1, 0, 0])
         ods2 = {'pts': 500.0, 'type': _SEG_ODS, 'data': self._make_ods_data(1, 1, rle2)}
 
-        results = _extract_subtitle_images([pcs1, pds1, ods1, pcs2, ods2])
+        results = list(_iter_subtitle_images([pcs1, pds1, ods1, pcs2, ods2]))
 
         assert len(results) == 2
         assert results[0][0] == pytest.approx(100.0)
         assert results[1][0] == pytest.approx(500.0)
 
     def test_empty_segments(self):
-        results = _extract_subtitle_images([])
+        results = list(_iter_subtitle_images([]))
         assert results == []
 
     def test_palette_update_applies_to_subsequent_images(self):
@@ -438,7 +447,7 @@ class TestExtractSubtitleImages:
         rle2 = bytes([1, 0, 0])
         ods2 = {'pts': 500.0, 'type': _SEG_ODS, 'data': self._make_ods_data(1, 1, rle2)}
 
-        results = _extract_subtitle_images([pcs1, pds1, ods1, pcs2, pds2, ods2])
+        results = list(_iter_subtitle_images([pcs1, pds1, ods1, pcs2, pds2, ods2]))
 
         assert len(results) == 2
         # First image uses Y=100
@@ -756,3 +765,40 @@ class TestExtractPgsTrack:
 
         sup_path = tmp_path / 'pgs_ocr' / 'track.sup'
         assert not sup_path.exists(), '.sup file should be cleaned up after extraction'
+
+
+# ---------------------------------------------------------------------------
+# map_ocr (parallel OCR fan-out)
+# ---------------------------------------------------------------------------
+
+
+class TestMapOcr:
+    def test_preserves_order_when_parallel(self):
+        with patch('movie_translator.ocr.vision_ocr._OCR_WORKERS', 4):
+            result = list(map_ocr(lambda x: x * 2, range(100)))
+
+        assert result == [x * 2 for x in range(100)]
+
+    def test_consumes_lazy_input_a_window_ahead(self):
+        produced = []
+
+        def items():
+            for x in range(100):
+                produced.append(x)
+                yield x
+
+        with (
+            patch('movie_translator.ocr.vision_ocr._OCR_WORKERS', 4),
+            patch('movie_translator.ocr.vision_ocr._OCR_WINDOW', 8),
+        ):
+            results = map_ocr(lambda x: x, items())
+            assert next(results) == 0
+            assert len(produced) == 8
+            assert list(results) == list(range(1, 100))
+
+    def test_small_batches_run_inline(self):
+        with patch('movie_translator.ocr.vision_ocr.ThreadPoolExecutor') as pool:
+            result = list(map_ocr(str, [1, 2, 3]))
+
+        pool.assert_not_called()
+        assert result == ['1', '2', '3']
@@ -1,10 +1,17 @@
+import os
 import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from ..logging import logger
 from ..types import BoundingBox
 
 
+@lru_cache(maxsize=1)
 def is_available() -> bool:
     if sys.platform != 'darwin':
         return False
@@ -17,6 +24,37 @@ def is_available() -> bool:
         return False
 
 
+# Vision requests are independent and PyObjC drops the GIL while Vision runs,
+# so large OCR jobs are spread over a few threads. Small jobs stay serial.
+_OCR_WORKERS = min(4, os.cpu_count() or 1)
+_OCR_PARALLEL_MIN = 16
+# Items submitted ahead of the one being yielded. Bounds how much of a lazy
+# input (e.g. decoded bitmaps) is held in memory at once.
+_OCR_WINDOW = 2 * _OCR_WORKERS
+
+
+def map_ocr(func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+    """Apply an OCR call to every item, in parallel for large batches.
+
+    Results are yielded in input order, so callers can keep building
+    timelines (and logging progress) as they arrive. *items* is consumed
+    lazily, only a small window ahead of the results, so a generator that
+    produces items (decoding, cropping) overlaps with recognition. Sized
+    inputs below _OCR_PARALLEL_MIN run inline.
+    """
+    if _OCR_WORKERS < 2 or (isinstance(items, Sized) and len(items) < _OCR_PARALLEL_MIN):
+        yield from map(func, items)
+        return
+    with ThreadPoolExecutor(max_workers=_OCR_WORKERS, thread_name_prefix='ocr') as pool:
+        pending: deque[Future] = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= _OCR_WINDOW:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def recognize_text_with_boxes(
     image_path: Path, language: str = 'en'
 ) -> list[tuple[str, BoundingBox]]:
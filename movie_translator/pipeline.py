@@ -82,6 +82,7 @@ class TranslationPipeline:
         tracker=None,
         metrics=None,
         external_subs_dir: Path | None = None,
+        sidecar_subs: bool = False,
     ):
         self.config = PipelineConfig(
             device=device,
@@ -90,6 +91,7 @@ class TranslationPipeline:
             enable_fetch=enable_fetch,
             enable_inpaint=enable_inpaint,
             external_subs_dir=external_subs_dir,
+            sidecar_subs=sidecar_subs,
             model_cache=ModelCache(),
         )
         self.tracker = tracker
@@ -93,7 +93,8 @@ class CreateTracksStage:
             else:
                 replace_chars = True
 
-        # Create AI Polish subtitle file
+        # Create AI Polish subtitle file. The fallback font is applied while
+        # writing rather than by reloading the saved file.
         with ctx.metrics.span('create_polish_subtitles'):
             ai_polish_ass = ctx.work_dir / f'{ctx.video_path.stem}_polish_ai.ass'
             SubtitleProcessor.create_polish_subtitles(
@@ -101,14 +102,9 @@ class CreateTracksStage:
                 ctx.translated_lines,
                 ai_polish_ass,
                 replace_chars,
+                font_name=ctx.font_info.fallback_font_family,
             )
 
-        if ctx.font_info.fallback_font_family:
-            with ctx.metrics.span('override_font'):
-                SubtitleProcessor.override_font_name(
-                    ai_polish_ass, ctx.font_info.fallback_font_family
-                )
-
         # Build track list
         with ctx.metrics.span('build_track_list') as s:
             fetched_pol_list = ctx.fetched_subtitles.get('pol', []) if ctx.fetched_subtitles else []
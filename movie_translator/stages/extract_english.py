@@ -5,9 +5,7 @@ from pathlib import Path
 from ..context import PendingOcr, PipelineContext
 from ..logging import logger
 from ..ocr import is_vision_ocr_available
-from ..subtitles import SubtitleExtractor, SubtitleProcessor
-
-_IMAGE_CODECS = ('hdmv_pgs_subtitle', 'dvd_subtitle', 'dvb_subtitle')
+from ..subtitles import SubtitleExtractor, SubtitleProcessor, is_image_track
 
 
 class ExtractEnglishStage:
@@ -75,9 +73,7 @@ class ExtractEnglishStage:
 
         eng_track = extractor.find_english_track(track_info)
         if eng_track:
-            codec = eng_track.get('codec', '').lower()
-            is_image = any(codec == c or codec.startswith(c) for c in _IMAGE_CODECS)
-            if not is_image:
+            if not is_image_track(eng_track):
                 with ctx.metrics.span('extract_subtitle'):
                     subtitle_ext = extractor.get_subtitle_extension(eng_track)
                     output = ctx.work_dir / f'{ctx.video_path.stem}_extracted{subtitle_ext}'
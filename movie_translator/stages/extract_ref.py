@@ -3,15 +3,7 @@
 from ..context import OriginalTrack, PendingOcr, PipelineContext
 from ..logging import logger
 from ..ocr import is_vision_ocr_available
-from ..subtitles import SubtitleExtractor
-
-# PGS/DVD/DVB image-based codecs that need OCR extraction
-_IMAGE_CODECS = ('hdmv_pgs_subtitle', 'dvd_subtitle', 'dvb_subtitle')
-
-
-def _is_image_codec(track: dict) -> bool:
-    codec = track.get('codec', '').lower()
-    return any(codec == c or codec.startswith(c) for c in _IMAGE_CODECS)
+from ..subtitles import SubtitleExtractor, is_image_track
 
 
 class ExtractReferenceStage:
@@ -40,7 +32,7 @@ class ExtractReferenceStage:
                 language=eng_track.get('properties', {}).get('language', 'eng'),
             )
 
-            if _is_image_codec(eng_track):
+            if is_image_track(eng_track):
                 # Defer PGS/DVD OCR
                 ctx.pending_ocr = PendingOcr(
                     type='pgs',
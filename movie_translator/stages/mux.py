@@ -1,6 +1,9 @@
 """Final video muxing stage — combines video with subtitle tracks."""
 
+import errno
+import os
 import shutil
+import sys
 from pathlib import Path
 
 from ..context import PipelineContext
@@ -9,6 +12,115 @@ from ..logging import logger
 from ..types import SubtitleFile
 from ..video import VideoOperations
 
+# _IOW(0x94, 9, int) from <linux/fs.h>
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone (APFS clonefile, btrfs/XFS reflink). Returns success.
+
+    Calls the syscalls directly rather than spawning ``cp``; on any failure
+    *dst* is left absent so the caller can fall back to a full copy.
+    """
+    if sys.platform == 'darwin':
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    if not sys.platform.startswith('linux'):
+        return False
+
+    import fcntl
+
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                fdst.close()
+                dst.unlink()
+                return False
+        shutil.copystat(src, dst)
+    except OSError:
+        return False
+    return True
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Tell the kernel a file we just streamed through won't be read again.
+
+    A full-video copy otherwise leaves gigabytes of page cache behind,
+    evicting pages that matter (e.g. model weights). Dirty pages are
+    queued for writeback rather than dropped. No-op where posix_fadvise
+    is unavailable (macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _fast_backup(src: Path, dst: Path) -> None:
+    """Make *dst* a backup of *src* without rewriting the data where possible.
+
+    The backup only has to keep the original's data reachable while the new
+    file is moved over it, so a hardlink is enough. Where links aren't
+    supported a copy-on-write clone is tried before a full copy.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    if not _clone_file(src, dst):
+        shutil.copy2(src, dst)
+        _drop_page_cache(src)
+
+
+def _finalize(temp_output: Path, final_path: Path) -> bool:
+    """Move the muxed file into place, atomically when both share a filesystem.
+
+    The work dir normally sits next to the input (``.translate_temp``), so this
+    is a rename. Across filesystems the data has to be copied; copyfile skips
+    the metadata pass that shutil.move's copy2 would do. The copy goes to a
+    sibling first and is renamed over *final_path*, so a hardlinked backup of
+    the old file is never written through.
+
+    Returns True if the data was copied rather than renamed.
+    """
+    try:
+        os.replace(temp_output, final_path)
+        return False
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        logger.debug(f'{temp_output.parent} is on another filesystem, copying into place')
+        staged = final_path.with_name(f'.{final_path.name}.partial')
+        try:
+            shutil.copyfile(temp_output, staged)
+            _drop_page_cache(staged)
+            os.replace(staged, final_path)
+        except BaseException:
+            staged.unlink(missing_ok=True)
+            raise
+        temp_output.unlink()
+        return True
+
+
+def _same_filesystem(a: Path, b: Path) -> bool:
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return True
+
 
 class MuxStage:
     name = 'mux'
@@ -34,6 +146,13 @@ class MuxStage:
         elif ctx.inpainted_video:
             source_video = ctx.inpainted_video
 
+        # Sidecar mode leaves the video untouched, so there is nothing to remux
+        # unless inpainting produced new frames.
+        if ctx.config.sidecar_subs and source_video == ctx.video_path:
+            with ctx.metrics.span('write_sidecars'):
+                self._write_sidecars(ctx)
+            return ctx
+
         # Determine original track preservation
         original_sub_index = None
         original_sub_title = None
@@ -45,35 +164,47 @@ class MuxStage:
         assert ctx.subtitle_tracks is not None
         assert ctx.font_info is not None
 
-        with ctx.metrics.span('create_clean_video') as s:
-            temp_video = ctx.work_dir / f'{ctx.video_path.stem}_temp{ctx.video_path.suffix}'
-            ops = VideoOperations()
-            s.detail('tracks', len(ctx.subtitle_tracks))
-            s.detail('font_attachments', len(ctx.font_info.font_attachments or []))
-            ops.create_clean_video(
-                source_video,
-                ctx.subtitle_tracks,
-                temp_video,
-                font_attachments=ctx.font_info.font_attachments or None,
-                original_sub_index=original_sub_index,
-                original_sub_title=original_sub_title,
-            )
-
-        # Build full expected track list including preserved original
-        expected_tracks = list(ctx.subtitle_tracks)
-        if original_sub_index is not None:
-            lang = ctx.original_english_track.language if ctx.original_english_track else 'eng'
-            expected_tracks.insert(
-                0,
-                SubtitleFile(
-                    path=Path(),  # placeholder, only count and language are checked
-                    language=lang,
-                    title=original_sub_title or 'English (Original)',
-                    is_default=False,
-                ),
-            )
-        with ctx.metrics.span('verify_result'):
-            ops.verify_result(temp_video, expected_tracks=expected_tracks)
+        temp_video = self._temp_output_path(ctx)
+        try:
+            with ctx.metrics.span('create_clean_video') as s:
+                ops = VideoOperations()
+                s.detail('tracks', len(ctx.subtitle_tracks))
+                s.detail('font_attachments', len(ctx.font_info.font_attachments or []))
+                ops.create_clean_video(
+                    source_video,
+                    ctx.subtitle_tracks,
+                    temp_video,
+                    font_attachments=ctx.font_info.font_attachments or None,
+                    original_sub_index=original_sub_index,
+                    original_sub_title=original_sub_title,
+                )
+
+            # Build full expected track list including preserved original
+            expected_tracks = list(ctx.subtitle_tracks)
+            if original_sub_index is not None:
+                lang = ctx.original_english_track.language if ctx.original_english_track else 'eng'
+                expected_tracks.insert(
+                    0,
+                    SubtitleFile(
+                        path=Path(),  # placeholder, only count and language are checked
+                        language=lang,
+                        title=original_sub_title or 'English (Original)',
+                        is_default=False,
+                    ),
+                )
+            with ctx.metrics.span('verify_result'):
+                ops.verify_result(temp_video, expected_tracks=expected_tracks)
+        except Exception:
+            # A sibling temp file would otherwise be left next to the user's video
+            if temp_video.parent != ctx.work_dir:
+                temp_video.unlink(missing_ok=True)
+            raise
+
+        # ffmpeg streamed the whole source through the page cache and wrote the
+        # whole output; neither is read again, so free the memory for the next
+        # file's model and frames.
+        _drop_page_cache(source_video)
+        _drop_page_cache(temp_video)
 
         if not ctx.config.dry_run:
             with ctx.metrics.span('replace_original'):
@@ -81,15 +212,50 @@ class MuxStage:
 
         return ctx
 
+    def _write_sidecars(self, ctx: PipelineContext) -> None:
+        """Copy the subtitle tracks next to the video as ``<stem>.<lang>[.N].<ext>``.
+
+        Players pick these up automatically, and skipping the mux avoids
+        reading and rewriting the whole video. The default track gets the
+        plain name; dry runs write into the work dir instead.
+        """
+        assert ctx.subtitle_tracks is not None
+        if ctx.font_info and ctx.font_info.font_attachments:
+            logger.warning('Sidecar subtitles cannot carry embedded fonts')
+
+        dest_dir = ctx.work_dir if ctx.config.dry_run else ctx.video_path.parent
+        tracks = sorted(ctx.subtitle_tracks, key=lambda t: not t.is_default)
+        seen: dict[str, int] = {}
+        for track in tracks:
+            n = seen[track.language] = seen.get(track.language, 0) + 1
+            label = track.language if n == 1 else f'{track.language}.{n}'
+            dest = dest_dir / f'{ctx.video_path.stem}.{label}{track.path.suffix}'
+            shutil.copyfile(track.path, dest)
+            logger.info(f'Wrote {dest.name}')
+
+    def _temp_output_path(self, ctx: PipelineContext) -> Path:
+        """Where to mux to: the work dir, unless that would make the final move a copy.
+
+        When the work dir lives on another filesystem than the video, the muxed
+        file is written as a hidden sibling of the video instead so replacing
+        the original stays a rename. Dry runs keep everything in the work dir.
+        """
+        name = f'{ctx.video_path.stem}_temp{ctx.video_path.suffix}'
+        if ctx.config.dry_run or _same_filesystem(ctx.work_dir, ctx.video_path.parent):
+            return ctx.work_dir / name
+        logger.debug('Work dir is on another filesystem, muxing next to the original')
+        return ctx.video_path.parent / f'.{name}'
+
     def _replace_original(self, video_path, temp_video):
         backup_path = video_path.with_suffix(video_path.suffix + '.backup')
-        shutil.copy2(video_path, backup_path)
+        _fast_backup(video_path, backup_path)
         try:
-            shutil.move(str(temp_video), str(video_path))
-            ops = VideoOperations()
-            ops.verify_result(video_path)
+            # The temp file was verified after muxing. A rename can't change its
+            # bytes, so only a cross-filesystem copy needs checking again.
+            if _finalize(temp_video, video_path):
+                VideoOperations().verify_result(video_path)
             backup_path.unlink()
         except Exception:
             if backup_path.exists() and not video_path.exists():
-                shutil.move(str(backup_path), str(video_path))
+                os.replace(backup_path, video_path)
             raise
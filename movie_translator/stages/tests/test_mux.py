@@ -1,3 +1,7 @@
+import errno
+import os
+import shutil
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -8,9 +12,22 @@ from movie_translator.context import (
     PipelineConfig,
     PipelineContext,
 )
-from movie_translator.stages.mux import MuxStage
+from movie_translator.stages.mux import MuxStage, _clone_file
 from movie_translator.types import BoundingBox, OCRResult, SubtitleFile
 
+_real_replace = os.replace
+
+
+def _cross_device_from(src):
+    """os.replace stand-in that fails with EXDEV for moves out of *src*."""
+
+    def replace(a, b):
+        if a == src:
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+        return _real_replace(a, b)
+
+    return replace
+
 
 class TestMuxStage:
     def _make_ctx(self, tmp_path, dry_run=False):
@@ -67,6 +84,19 @@ class TestMuxStage:
         # Original should still contain 'fake video'
         assert ctx.video_path.read_text() == 'fake video'
 
+    def test_drops_source_and_output_from_page_cache_after_mux(self, tmp_path):
+        ctx = self._make_ctx(tmp_path, dry_run=True)
+        temp_video = ctx.work_dir / f'{ctx.video_path.stem}_temp.mkv'
+        temp_video.write_text('output')
+
+        with (
+            patch('movie_translator.stages.mux.VideoOperations'),
+            patch('movie_translator.stages.mux._drop_page_cache') as drop,
+        ):
+            MuxStage().run(ctx)
+
+        assert [c.args[0] for c in drop.call_args_list] == [ctx.video_path, temp_video]
+
     def test_no_original_track_passes_none(self, tmp_path):
         ctx = self._make_ctx(tmp_path)
         ctx.original_english_track = None
@@ -193,7 +223,10 @@ class TestMuxStage:
         temp_video = tmp_path / 'ep01_temp.mkv'
         temp_video.write_text('muxed content')
 
-        with patch('movie_translator.stages.mux.VideoOperations') as MockOps:
+        with (
+            patch('movie_translator.stages.mux.VideoOperations') as MockOps,
+            patch('movie_translator.stages.mux.os.replace', _cross_device_from(temp_video)),
+        ):
             mock_ops = MockOps.return_value
             mock_ops.verify_result.side_effect = RuntimeError('verification failed')
 
@@ -201,14 +234,116 @@ class TestMuxStage:
                 MuxStage()._replace_original(video, temp_video)
 
         # After rollback, the original file should be restored from backup.
-        # The shutil.move in the try block already replaced the original, so
+        # The copy in the try block already replaced the original, so
         # the rollback branch checks backup_path.exists() and not video_path.exists().
-        # Since shutil.move succeeded before verify raised, video exists with muxed content
+        # Since the copy succeeded before verify raised, video exists with muxed content
         # and backup still exists. The rollback condition (not video_path.exists()) is False,
         # so backup is not moved back. The backup file should still exist for manual recovery.
         backup = video.with_suffix('.mkv.backup')
         assert backup.exists()
 
+    def test_replace_original_backup_keeps_original_content(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.write_text('original content')
+        temp_video = tmp_path / 'ep01_temp.mkv'
+        temp_video.write_text('muxed content')
+
+        with (
+            patch('movie_translator.stages.mux.VideoOperations') as MockOps,
+            patch('movie_translator.stages.mux.os.replace', _cross_device_from(temp_video)),
+        ):
+            MockOps.return_value.verify_result.side_effect = RuntimeError('verification failed')
+
+            with pytest.raises(RuntimeError):
+                MuxStage()._replace_original(video, temp_video)
+
+        # The backup is a link to the original inode, so replacing the video
+        # path must not change what the backup holds.
+        assert video.with_suffix('.mkv.backup').read_text() == 'original content'
+
+    def test_replace_original_falls_back_to_copy_without_hardlinks(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.write_text('original content')
+        temp_video = tmp_path / 'ep01_temp.mkv'
+        temp_video.write_text('muxed content')
+
+        with (
+            patch('movie_translator.stages.mux.VideoOperations'),
+            patch('movie_translator.stages.mux.os.link', side_effect=OSError('not supported')),
+            patch('movie_translator.stages.mux._clone_file', return_value=False),
+            patch('movie_translator.stages.mux.shutil.copy2', wraps=shutil.copy2) as copy2,
+        ):
+            MuxStage()._replace_original(video, temp_video)
+
+        copy2.assert_called_once()
+        assert video.read_text() == 'muxed content'
+
+    def test_full_backup_copy_drops_source_from_page_cache(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.write_text('original content')
+        temp_video = tmp_path / 'ep01_temp.mkv'
+        temp_video.write_text('muxed content')
+
+        with (
+            patch('movie_translator.stages.mux.VideoOperations'),
+            patch('movie_translator.stages.mux.os.link', side_effect=OSError('not supported')),
+            patch('movie_translator.stages.mux._clone_file', return_value=False),
+            patch('movie_translator.stages.mux._drop_page_cache') as drop,
+        ):
+            MuxStage()._replace_original(video, temp_video)
+
+        drop.assert_called_once_with(video)
+
+    def test_replace_original_prefers_clone_over_copy(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.write_text('original content')
+        temp_video = tmp_path / 'ep01_temp.mkv'
+        temp_video.write_text('muxed content')
+
+        def fake_clone(src, dst):
+            shutil.copyfile(src, dst)
+            return True
+
+        with (
+            patch('movie_translator.stages.mux.VideoOperations'),
+            patch('movie_translator.stages.mux.os.link', side_effect=OSError('not supported')),
+            patch('movie_translator.stages.mux._clone_file', side_effect=fake_clone) as clone,
+            patch('movie_translator.stages.mux.shutil.copy2') as copy2,
+        ):
+            MuxStage()._replace_original(video, temp_video)
+
+        clone.assert_called_once()
+        copy2.assert_not_called()
+
+    def test_replace_original_skips_verify_after_rename(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.write_text('original content')
+        temp_video = tmp_path / 'ep01_temp.mkv'
+        temp_video.write_text('muxed content')
+
+        with patch('movie_translator.stages.mux.VideoOperations') as MockOps:
+            MuxStage()._replace_original(video, temp_video)
+
+        MockOps.return_value.verify_result.assert_not_called()
+        assert video.read_text() == 'muxed content'
+
+    def test_replace_original_copies_across_filesystems(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.write_text('original content')
+        temp_video = tmp_path / 'ep01_temp.mkv'
+        temp_video.write_text('muxed content')
+
+        with (
+            patch('movie_translator.stages.mux.VideoOperations') as MockOps,
+            patch('movie_translator.stages.mux.os.replace', _cross_device_from(temp_video)),
+        ):
+            MuxStage()._replace_original(video, temp_video)
+
+        MockOps.return_value.verify_result.assert_called_once_with(video)
+        assert video.read_text() == 'muxed content'
+        assert not temp_video.exists()
+        assert not video.with_suffix('.mkv.backup').exists()
+
     def test_replace_original_rolls_back_when_move_fails(self, tmp_path):
         video = tmp_path / 'ep01.mkv'
         video.write_text('original content')
@@ -217,7 +352,7 @@ class TestMuxStage:
 
         with (
             patch('movie_translator.stages.mux.VideoOperations'),
-            patch('movie_translator.stages.mux.shutil.move', side_effect=OSError('disk full')),
+            patch('movie_translator.stages.mux.os.replace', side_effect=OSError('disk full')),
         ):
             with pytest.raises(OSError, match='disk full'):
                 MuxStage()._replace_original(video, temp_video)
@@ -228,6 +363,89 @@ class TestMuxStage:
         backup = video.with_suffix('.mkv.backup')
         assert backup.exists()
 
+    def test_muxes_next_to_video_when_work_dir_on_other_filesystem(self, tmp_path):
+        ctx = self._make_ctx(tmp_path)
+
+        def _mux(src, subs, out, **kw):
+            out.write_text('muxed')
+
+        with (
+            patch('movie_translator.stages.mux._same_filesystem', return_value=False),
+            patch('movie_translator.stages.mux.VideoOperations') as MockOps,
+        ):
+            mock_ops = MockOps.return_value
+            mock_ops.create_clean_video.side_effect = _mux
+            MuxStage().run(ctx)
+
+            out_path = mock_ops.create_clean_video.call_args.args[2]
+
+        assert out_path.parent == ctx.video_path.parent
+        assert out_path.name.startswith('.')
+        assert ctx.video_path.read_text() == 'muxed'
+
+    def test_sibling_temp_removed_when_mux_fails(self, tmp_path):
+        ctx = self._make_ctx(tmp_path)
+
+        def _fail(src, subs, out, **kw):
+            out.write_text('partial')
+            raise RuntimeError('mkvmerge failed')
+
+        with (
+            patch('movie_translator.stages.mux._same_filesystem', return_value=False),
+            patch('movie_translator.stages.mux.VideoOperations') as MockOps,
+        ):
+            MockOps.return_value.create_clean_video.side_effect = _fail
+            with pytest.raises(RuntimeError):
+                MuxStage().run(ctx)
+
+        assert not (tmp_path / '.ep01_temp.mkv').exists()
+        assert ctx.video_path.read_text() == 'fake video'
+
+    def test_dry_run_keeps_temp_in_work_dir_across_filesystems(self, tmp_path):
+        ctx = self._make_ctx(tmp_path, dry_run=True)
+
+        with (
+            patch('movie_translator.stages.mux._same_filesystem', return_value=False),
+            patch('movie_translator.stages.mux.VideoOperations') as MockOps,
+        ):
+            MuxStage().run(ctx)
+            out_path = MockOps.return_value.create_clean_video.call_args.args[2]
+
+        assert out_path.parent == ctx.work_dir
+
+    # ------------------------------------------------------------------
+    # Sidecar subtitles
+    # ------------------------------------------------------------------
+
+    def test_sidecar_mode_skips_mux(self, tmp_path):
+        ctx = self._make_ctx(tmp_path)
+        ctx.config.sidecar_subs = True
+        fetched = tmp_path / 'fetched.srt'
+        fetched.write_text('fetched')
+        ai = ctx.subtitle_tracks[0].path
+        ai.write_text('ai')
+        ctx.subtitle_tracks = [
+            SubtitleFile(fetched, 'pol', 'Polish (animesub)', is_default=True),
+            SubtitleFile(ai, 'pol', 'Polish (AI)', is_default=False),
+        ]
+
+        with patch('movie_translator.stages.mux.VideoOperations') as MockOps:
+            MuxStage().run(ctx)
+
+        MockOps.return_value.create_clean_video.assert_not_called()
+        assert ctx.video_path.read_text() == 'fake video'
+        assert (tmp_path / 'ep01.pol.srt').read_text() == 'fetched'
+        assert (tmp_path / 'ep01.pol.2.ass').read_text() == 'ai'
+
+    def test_sidecar_mode_dry_run_writes_to_work_dir(self, tmp_path):
+        ctx = self._make_ctx(tmp_path, dry_run=True)
+        ctx.config.sidecar_subs = True
+
+        MuxStage().run(ctx)
+
+        assert (ctx.work_dir / 'ep01.pol.ass').exists()
+        assert not (tmp_path / 'ep01.pol.ass').exists()
+
     # ------------------------------------------------------------------
     # Font attachments
     # ------------------------------------------------------------------
@@ -288,3 +506,27 @@ class TestMuxStage:
 
             with pytest.raises(RuntimeError, match='wrong track count'):
                 MuxStage().run(ctx)
+
+
+class TestCloneFile:
+    def test_clone_or_clean_failure(self, tmp_path):
+        src = tmp_path / 'ep01.mkv'
+        src.write_bytes(b'video data')
+        dst = tmp_path / 'ep01.mkv.backup'
+
+        # Whether the filesystem supports reflinks depends on the host; either
+        # way the result must be a full clone or no file at all.
+        if _clone_file(src, dst):
+            assert dst.read_bytes() == b'video data'
+        else:
+            assert not dst.exists()
+
+    def test_existing_destination_is_not_clobbered(self, tmp_path):
+        src = tmp_path / 'ep01.mkv'
+        src.write_bytes(b'video data')
+        dst = tmp_path / 'ep01.mkv.backup'
+        dst.write_bytes(b'old backup')
+
+        if sys.platform.startswith('linux'):
+            assert not _clone_file(src, dst)
+            assert dst.read_bytes() == b'old backup'
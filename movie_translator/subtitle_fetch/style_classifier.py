@@ -36,7 +36,7 @@ def classify_styles(subs) -> set[str]:
         if not text.strip():
             continue
 
-        style = getattr(event, 'style', 'Default')
+        style = event.style
         if style not in style_metrics:
             style_metrics[style] = {
                 'count': 0,
@@ -20,7 +20,7 @@ import numpy as np
 
 from ..logging import logger
 from ..subtitles._pysubs2 import get_pysubs2
-from ..types import NON_DIALOGUE_STYLES
+from ..types import is_non_dialogue_style
 from .style_classifier import classify_styles
 from .types import SubtitleMatch
 
@@ -270,7 +270,7 @@ def extract_timestamps(subtitle_path: Path) -> tuple[list[tuple[int, int]], int]
         if not event.text or not event.text.strip():
             continue
 
-        style = getattr(event, 'style', 'Default')
+        style = event.style
 
         # Primary: structural classifier
         if style not in dialogue_styles:
@@ -278,8 +278,7 @@ def extract_timestamps(subtitle_path: Path) -> tuple[list[tuple[int, int]], int]
 
         # Secondary: keyword filter catches song lyrics that look like
         # dialogue structurally (unpositioned, normal text length)
-        style_lower = style.lower()
-        if any(keyword in style_lower for keyword in NON_DIALOGUE_STYLES):
+        if is_non_dialogue_style(style):
             continue
 
         # Skip empty plaintext (after stripping ASS tags)
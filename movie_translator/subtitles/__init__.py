@@ -1,4 +1,4 @@
-from .extractor import SubtitleExtractionError, SubtitleExtractor
+from .extractor import SubtitleExtractionError, SubtitleExtractor, is_image_track
 from .processor import SubtitleProcessingError, SubtitleProcessor
 
 __all__ = [
@@ -6,4 +6,5 @@ __all__ = [
     'SubtitleExtractor',
     'SubtitleProcessingError',
     'SubtitleProcessor',
+    'is_image_track',
 ]
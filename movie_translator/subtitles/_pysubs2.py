@@ -1,4 +1,5 @@
 from functools import lru_cache
+from pathlib import Path
 
 from ..logging import logger
 
@@ -12,3 +13,23 @@ def get_pysubs2():
     except ImportError:
         logger.error('pysubs2 package not found. Install with: uv add pysubs2')
         return None
+
+
+def load_subs(path: Path):
+    """pysubs2.load, memoized while the file is unchanged.
+
+    The English source is parsed for dialogue, for its font names and again
+    as the template of the Polish track; this parses it once. The returned
+    SSAFile is shared, so callers must not mutate it. Files the pipeline
+    rewrites in place (alignment, font overrides) should keep using
+    pysubs2.load, since a same-size rewrite can land within one mtime tick.
+    """
+    st = path.stat()
+    return _load_subs(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_subs(path_str: str, mtime_ns: int, size: int):
+    pysubs2 = get_pysubs2()
+    assert pysubs2 is not None
+    return pysubs2.load(path_str)
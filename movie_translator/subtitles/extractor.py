@@ -7,14 +7,20 @@ from ..ffmpeg import get_ffmpeg, get_video_info
 from ..logging import logger
 from ..types import NON_DIALOGUE_STYLES
 
+# A track name marks signs/songs if it contains any keyword as a whole word,
+# optionally pluralised ("Signs", "Songs & Titles").
+_SIGNS_TRACK_RE = re.compile(rf'\b(?:{"|".join(map(re.escape, NON_DIALOGUE_STYLES))})s?\b')
+# Lines of ffmpeg's stderr worth surfacing when an extraction fails.
+_FFMPEG_ERROR_LINE_RE = re.compile(r'^.*(?:error|invalid).*$', re.IGNORECASE | re.MULTILINE)
+
 
 class SubtitleExtractionError(Exception):
     pass
 
 
 class SubtitleExtractor:
-    TEXT_CODECS = ('ass', 'ssa', 'subrip', 'srt', 'webvtt', 'mov_text')
     IMAGE_CODECS = ('hdmv_pgs_subtitle', 'dvd_subtitle', 'dvb_subtitle')
+    SUBTITLE_EXTENSIONS = {'ass': '.ass', 'ssa': '.ssa', 'webvtt': '.vtt'}
 
     def __init__(self):
         pass
@@ -27,27 +33,27 @@ class SubtitleExtractor:
         return self._convert_ffprobe_info(info)
 
     def _convert_ffprobe_info(self, ffprobe_info: dict[str, Any]) -> dict[str, Any]:
-        streams = ffprobe_info.get('streams', [])
+        sub_streams = [
+            s for s in ffprobe_info.get('streams', []) if s.get('codec_type') == 'subtitle'
+        ]
         tracks = []
-        subtitle_index = 0
-
-        for stream in streams:
-            codec_type = stream.get('codec_type', '')
-            if codec_type == 'subtitle':
-                track = {
+        for subtitle_index, stream in enumerate(sub_streams):
+            tags = stream.get('tags', {})
+            codec = stream.get('codec_name', '')
+            tracks.append(
+                {
                     'id': stream.get('index'),
                     'type': 'subtitles',
-                    'codec': stream.get('codec_name', ''),
+                    'codec': codec,
                     'properties': {
-                        'language': stream.get('tags', {}).get('language', 'und'),
-                        'track_name': stream.get('tags', {}).get('title', ''),
-                        'codec_id': stream.get('codec_name', ''),
+                        'language': tags.get('language', 'und'),
+                        'track_name': tags.get('title', ''),
+                        'codec_id': codec,
                         'forced_track': stream.get('disposition', {}).get('forced', 0) == 1,
                     },
                     'subtitle_index': subtitle_index,
                 }
-                tracks.append(track)
-                subtitle_index += 1
+            )
 
         return {'tracks': tracks}
 
@@ -152,12 +158,7 @@ class SubtitleExtractor:
                 continue
 
             # Only mark as signs if the track name explicitly indicates it
-            is_signs = any(
-                re.search(rf'\b{re.escape(keyword)}s?\b', track_name)
-                for keyword in NON_DIALOGUE_STYLES
-            )
-
-            if is_signs:
+            if _SIGNS_TRACK_RE.search(track_name):
                 signs_tracks.append(track)
             else:
                 dialogue_tracks.append(track)
@@ -210,14 +211,12 @@ class SubtitleExtractor:
         return english_tracks[0]
 
     def _separate_by_codec(self, tracks: list[dict]) -> tuple[list[dict], list[dict]]:
+        # Unknown codecs are treated as text; no text codec shares an image prefix.
         text_tracks = []
         image_tracks = []
 
         for track in tracks:
-            codec = track.get('codec', '').lower()
-            if any(codec == c or codec.startswith(c) for c in self.TEXT_CODECS):
-                text_tracks.append(track)
-            elif any(codec == c or codec.startswith(c) for c in self.IMAGE_CODECS):
+            if is_image_track(track):
                 image_tracks.append(track)
             else:
                 text_tracks.append(track)
@@ -231,17 +230,8 @@ class SubtitleExtractor:
         return image_tracks[0]
 
     def get_subtitle_extension(self, track: dict[str, Any]) -> str:
-        codec = track.get('codec', '').lower()
-
-        if codec in ('ass', 'ssa'):
-            return f'.{codec}'
-        elif codec in ('subrip', 'srt'):
-            return '.srt'
-        elif codec == 'webvtt':
-            return '.vtt'
-        elif codec == 'mov_text':
-            return '.srt'
-        return '.srt'
+        # Everything else (subrip, srt, mov_text, unknown) is written as SRT.
+        return self.SUBTITLE_EXTENSIONS.get(track.get('codec', '').lower(), '.srt')
 
     def extract_subtitle(
         self, video_path: Path, track_id: int, output_path: Path, subtitle_index: int | None = None
@@ -267,16 +257,39 @@ class SubtitleExtractor:
             str(output_path),
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        self._run_extraction(cmd, f'subtitle track {track_id}')
+
+        logger.info(f'Extraction successful: {output_path.name}')
+
+    def extract_subtitles(self, video_path: Path, outputs: list[tuple[int, Path]]) -> None:
+        """Extract several subtitle streams in one ffmpeg pass.
+
+        *outputs* pairs a subtitle stream index (``0:s:N``) with its output
+        path. ffmpeg reads through the whole container for any extraction,
+        so one invocation with an output per stream costs a single scan.
+        """
+        if not video_path.exists():
+            raise SubtitleExtractionError(f'Video file not found: {video_path}')
+        if not outputs:
+            return
+
+        logger.info(f'Extracting {len(outputs)} subtitle track(s)...')
+
+        cmd = [get_ffmpeg(), '-y', '-i', str(video_path)]
+        for sub_idx, output_path in outputs:
+            cmd += ['-map', f'0:s:{sub_idx}', '-c:s', 'copy', str(output_path)]
+
+        self._run_extraction(cmd, f'{len(outputs)} subtitle tracks')
+
+    def _run_extraction(self, cmd: list[str], what: str) -> None:
+        # Only stderr is read, and only on failure; stdout is never consulted.
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         if result.returncode != 0:
-            error_lines = [
-                line
-                for line in result.stderr.split('\n')
-                if 'error' in line.lower() or 'invalid' in line.lower()
-            ]
+            error_lines = _FFMPEG_ERROR_LINE_RE.findall(result.stderr)
             error_msg = '; '.join(error_lines) if error_lines else 'Unknown ffmpeg error'
-            raise SubtitleExtractionError(
-                f'Failed to extract subtitle track {track_id}: {error_msg}'
-            )
+            raise SubtitleExtractionError(f'Failed to extract {what}: {error_msg}')
 
-        logger.info(f'Extraction successful: {output_path.name}')
+
+def is_image_track(track: dict[str, Any]) -> bool:
+    """Whether *track* is bitmap-based (PGS/DVD/DVB) and needs OCR."""
+    return track.get('codec', '').lower().startswith(SubtitleExtractor.IMAGE_CODECS)
@@ -1,11 +1,12 @@
 """Unified subtitle processor combining parsing, writing, and validation."""
 
 from collections.abc import Callable
+from operator import attrgetter
 from pathlib import Path
 
 from ..logging import logger
-from ..types import NON_DIALOGUE_STYLES, DialogueLine, replace_polish_chars
-from ._pysubs2 import get_pysubs2
+from ..types import DialogueLine, is_non_dialogue_style, replace_polish_chars
+from ._pysubs2 import get_pysubs2, load_subs
 
 
 class SubtitleProcessingError(Exception):
@@ -61,16 +62,13 @@ class SubtitleProcessor:
             raise SubtitleProcessingError('pysubs2 library not available')
 
         try:
-            subs = pysubs2.load(str(subtitle_file))
+            subs = load_subs(subtitle_file)
         except Exception as e:
             raise SubtitleProcessingError(f'Failed to parse subtitle file: {e}') from e
 
         logger.debug(f'   - Loaded {len(subs)} total events')
 
-        unique_subs = SubtitleProcessor._deduplicate_events(subs)
-        dialogue_lines = SubtitleProcessor._filter_dialogue(unique_subs)
-
-        return dialogue_lines
+        return SubtitleProcessor._collect_dialogue(subs)
 
     @staticmethod
     def create_subtitle_file(
@@ -78,8 +76,13 @@ class SubtitleProcessor:
         dialogue_lines: list[DialogueLine],
         output_path: Path,
         text_transform: Callable[[str], str] | None = None,
+        font_name: str | None = None,
     ) -> None:
-        """Create a new subtitle file from dialogue lines."""
+        """Create a new subtitle file from dialogue lines.
+
+        If *font_name* is given, every style's font is replaced with it before
+        saving, so callers don't have to reload and rewrite the file.
+        """
         if not original_file.exists():
             raise SubtitleProcessingError(f'Original subtitle file not found: {original_file}')
 
@@ -88,31 +91,35 @@ class SubtitleProcessor:
             raise SubtitleProcessingError('pysubs2 library not available')
 
         try:
-            original_subs = pysubs2.load(str(original_file))
+            original_subs = load_subs(original_file)
         except Exception as e:
             raise SubtitleProcessingError(f'Failed to load original subtitle file: {e}') from e
 
+        # The parsed original is shared (see load_subs), so copy the styles
+        # themselves before they're modified below.
         new_subs = pysubs2.SSAFile()
         new_subs.info = original_subs.info.copy()
-        new_subs.styles = original_subs.styles.copy()
+        new_subs.styles = {name: style.copy() for name, style in original_subs.styles.items()}
+        if font_name:
+            for style in new_subs.styles.values():
+                style.fontname = font_name
 
         # Pick the dialogue style from the source file. The style must
         # exist in new_subs.styles or the player will use a bare fallback.
         dialogue_style = _find_dialogue_style(new_subs)
 
-        for line in dialogue_lines:
-            text = line.text
-            if text_transform:
-                text = text_transform(text)
-            text = text.replace('\n', '\\N')
-
-            event = pysubs2.SSAEvent(
+        texts = [line.text for line in dialogue_lines]
+        if text_transform:
+            texts = [text_transform(text) for text in texts]
+        new_subs.events = [
+            pysubs2.SSAEvent(
                 start=line.start_ms,
                 end=line.end_ms,
                 style=dialogue_style,
-                text=text,
+                text=text.replace('\n', '\\N'),
             )
-            new_subs.append(event)
+            for line, text in zip(dialogue_lines, texts, strict=True)
+        ]
 
         try:
             new_subs.save(str(output_path))
@@ -138,13 +145,16 @@ class SubtitleProcessor:
         translated_dialogue: list[DialogueLine],
         output_path: Path,
         replace_chars: bool = True,
+        font_name: str | None = None,
     ) -> None:
         """Create Polish subtitle file with optional character replacement."""
         logger.info('🔤 Creating Polish subtitles')
         text_transform = replace_polish_chars if replace_chars else None
         SubtitleProcessor.create_subtitle_file(
-            original_file, translated_dialogue, output_path, text_transform
+            original_file, translated_dialogue, output_path, text_transform, font_name
         )
+        if font_name:
+            logger.debug(f'   - Overrode font name to "{font_name}" in {output_path.name}')
 
     @staticmethod
     def override_font_name(ass_file: Path, new_font_name: str) -> None:
@@ -187,11 +197,7 @@ class SubtitleProcessor:
 
         logger.debug(f'   📊 Validation: Original file has {len(original_events)} non-empty events')
 
-        original_dialogue = [
-            e
-            for e in original_events
-            if not any(kw in getattr(e, 'style', 'Default').lower() for kw in NON_DIALOGUE_STYLES)
-        ]
+        original_dialogue = [e for e in original_events if not is_non_dialogue_style(e.style)]
         non_dialogue_count = len(original_events) - len(original_dialogue)
         logger.debug(
             f'   📊 Validation: {len(original_dialogue)} dialogue, {non_dialogue_count} non-dialogue (signs/songs/effects)'
@@ -201,12 +207,11 @@ class SubtitleProcessor:
             logger.warning('No dialogue events found in original file')
             return
 
-        original_start = min(e.start for e in original_dialogue)
-        original_end = max(e.end for e in original_dialogue)
+        first_dialogue = min(original_dialogue, key=attrgetter('start'))
+        last_dialogue = max(original_dialogue, key=attrgetter('end'))
+        original_start = first_dialogue.start
+        original_end = last_dialogue.end
         original_duration_sec = (original_end - original_start) / 1000
-
-        first_dialogue = min(original_dialogue, key=lambda e: e.start)
-        last_dialogue = max(original_dialogue, key=lambda e: e.end)
         logger.debug(
             f'   📊 Original dialogue range: {original_start}ms - {original_end}ms ({original_duration_sec:.1f}s)'
         )
@@ -218,12 +223,11 @@ class SubtitleProcessor:
 
         logger.debug(f'   📊 Validation: Cleaned file has {len(cleaned_events)} dialogue events')
 
-        cleaned_start = min(e.start for e in cleaned_events)
-        cleaned_end = max(e.end for e in cleaned_events)
+        first_cleaned = min(cleaned_events, key=attrgetter('start'))
+        last_cleaned = max(cleaned_events, key=attrgetter('end'))
+        cleaned_start = first_cleaned.start
+        cleaned_end = last_cleaned.end
         cleaned_duration_sec = (cleaned_end - cleaned_start) / 1000
-
-        first_cleaned = min(cleaned_events, key=lambda e: e.start)
-        last_cleaned = max(cleaned_events, key=lambda e: e.end)
         logger.debug(
             f'   📊 Cleaned dialogue range: {cleaned_start}ms - {cleaned_end}ms ({cleaned_duration_sec:.1f}s)'
         )
@@ -271,83 +275,41 @@ class SubtitleProcessor:
             logger.info('   ✅ Timing validation passed (with expected offsets)')
 
     @staticmethod
-    def _deduplicate_events(subs) -> list:
-        """Remove duplicate consecutive events with same text."""
-        original_count = len(subs)
-        unique_subs = []
-        last_text: str | None = None
-        current_group_start: int = 0
-        current_group_end: int = 0
-
-        pysubs2 = get_pysubs2()
-        assert pysubs2 is not None
-
+    def _collect_dialogue(subs) -> list[DialogueLine]:
+        """Merge repeated consecutive events and keep only dialogue.
+
+        Effect-heavy ASS tracks repeat one line across many layered events;
+        each run of identical text becomes a single line spanning the run,
+        attributed to the style of its first event. Runs in sign/song styles
+        are then dropped. One pass over the events, no intermediate SSAEvents.
+        """
+        runs: list[list] = []  # [start, end, text, style]
         for event in subs:
-            clean_text = event.plaintext.strip()
-
-            if not clean_text or len(clean_text) < 2:
+            text = event.text
+            # plaintext strips override tags and escapes; plain lines skip it.
+            clean_text = (event.plaintext if '{' in text or '\\' in text else text).strip()
+            if len(clean_text) < 2:
                 continue
-
-            if last_text == clean_text:
-                current_group_end = max(current_group_end, event.end)
+            if runs and runs[-1][2] == clean_text:
+                run = runs[-1]
+                if event.end > run[1]:
+                    run[1] = event.end
             else:
-                if last_text is not None and unique_subs:
-                    consolidated_event = pysubs2.SSAEvent(
-                        start=current_group_start,
-                        end=current_group_end,
-                        style=unique_subs[-1].style if unique_subs else 'Default',
-                        text=last_text,
-                    )
-                    unique_subs[-1] = consolidated_event
-
-                last_text = clean_text
-                current_group_start = event.start
-                current_group_end = event.end
-                unique_subs.append(event)
-
-        if last_text is not None and unique_subs:
-            consolidated_event = pysubs2.SSAEvent(
-                start=current_group_start,
-                end=current_group_end,
-                style=unique_subs[-1].style if unique_subs else 'Default',
-                text=last_text,
-            )
-            unique_subs[-1] = consolidated_event
+                runs.append([event.start, event.end, clean_text, event.style])
 
-        deduped_count = len(unique_subs)
-        if deduped_count < original_count:
-            removed = original_count - deduped_count
+        if len(runs) < len(subs):
             logger.debug(
-                f'   - Deduplicated: {original_count} → {deduped_count} entries '
-                f'(removed {removed} duplicate effect layers)'
+                f'   - Deduplicated: {len(subs)} → {len(runs)} entries '
+                f'(removed {len(subs) - len(runs)} duplicate effect layers)'
             )
 
-        return unique_subs
-
-    @staticmethod
-    def _filter_dialogue(events: list) -> list[DialogueLine]:
-        """Filter out non-dialogue events and convert to DialogueLine."""
-        dialogue_lines = []
-        skipped_count = 0
-
-        for event in events:
-            if not event.text or event.text.strip() == '':
-                skipped_count += 1
-                continue
-
-            style = getattr(event, 'style', 'Default').lower()
-            if any(keyword in style for keyword in NON_DIALOGUE_STYLES):
-                skipped_count += 1
-                continue
-
-            clean_text = event.plaintext.strip()
-            if not clean_text:
-                skipped_count += 1
-                continue
-
-            dialogue_lines.append(DialogueLine(event.start, event.end, clean_text))
+        dialogue_lines = [
+            DialogueLine(start, end, text)
+            for start, end, text, style in runs
+            if not is_non_dialogue_style(style)
+        ]
 
         logger.info(f'   - Extracted {len(dialogue_lines)} dialogue lines')
-        logger.info(f'   - Skipped {skipped_count} non-dialogue events')
+        logger.info(f'   - Skipped {len(runs) - len(dialogue_lines)} non-dialogue events')
 
         return dialogue_lines
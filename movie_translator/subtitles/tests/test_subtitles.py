@@ -1,13 +1,17 @@
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from movie_translator.fonts import get_ass_font_names
 from movie_translator.subtitles import (
     SubtitleExtractionError,
     SubtitleExtractor,
     SubtitleProcessingError,
     SubtitleProcessor,
+    is_image_track,
 )
+from movie_translator.subtitles._pysubs2 import load_subs
 
 
 class TestSubtitleProcessor:
@@ -39,6 +43,22 @@ class TestSubtitleProcessor:
 
         assert 'EPISODE 1' not in texts
 
+    def test_merges_repeated_effect_layers(self, create_ass_file, sample_ass_content):
+        header, _, _ = sample_ass_content.partition('Dialogue:')
+        ass_file = create_ass_file(
+            content=header
+            + 'Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,{\\blur3}Hello there\n'
+            + 'Dialogue: 1,0:00:01.00,0:00:02.50,Default,,0,0,0,,Hello there\n'
+            + 'Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Line one\\NLine two\n'
+        )
+
+        lines = SubtitleProcessor.extract_dialogue_lines(ass_file)
+
+        assert [tuple(line) for line in lines] == [
+            (1000, 2500, 'Hello there'),
+            (3000, 4000, 'Line one\nLine two'),
+        ]
+
     def test_returns_timing_tuples_from_ass(self, create_ass_file):
         ass_file = create_ass_file()
 
@@ -141,11 +161,47 @@ class TestFontOverride:
         for style in subs.styles.values():
             assert style.fontname == 'DejaVu Sans'
 
+    def test_create_polish_subtitles_with_font_name(
+        self, create_ass_file, tmp_path, sample_translated_lines
+    ):
+        output_path = tmp_path / 'polish.ass'
+        SubtitleProcessor.create_polish_subtitles(
+            create_ass_file(), sample_translated_lines, output_path, font_name='DejaVu Sans'
+        )
+
+        import pysubs2
+
+        subs = pysubs2.load(str(output_path))
+        assert subs.styles
+        for style in subs.styles.values():
+            assert style.fontname == 'DejaVu Sans'
+
+    def test_font_name_does_not_leak_into_later_loads(
+        self, create_ass_file, tmp_path, sample_translated_lines
+    ):
+        original = create_ass_file()
+        SubtitleProcessor.create_polish_subtitles(
+            original, sample_translated_lines, tmp_path / 'polish.ass', font_name='DejaVu Sans'
+        )
+
+        assert 'dejavu sans' not in get_ass_font_names(original)
+
     def test_override_font_name_nonexistent_file(self, tmp_path):
         with pytest.raises(SubtitleProcessingError):
             SubtitleProcessor.override_font_name(tmp_path / 'nonexistent.ass', 'Arial')
 
 
+class TestLoadSubs:
+    def test_reuses_parse_until_file_changes(self, create_ass_file):
+        ass_file = create_ass_file()
+
+        first = load_subs(ass_file)
+        assert load_subs(ass_file) is first
+
+        ass_file.write_text(ass_file.read_text() + '\n')
+        assert load_subs(ass_file) is not first
+
+
 class TestSubtitleExtractor:
     def test_get_track_info(self, create_test_mkv):
         mkv_file = create_test_mkv(language='eng')
@@ -156,6 +212,68 @@ class TestSubtitleExtractor:
         assert 'tracks' in track_info
         assert len(track_info['tracks']) == 1
 
+    def test_convert_ffprobe_info_numbers_subtitle_streams(self):
+        info = {
+            'streams': [
+                {'index': 0, 'codec_type': 'video', 'codec_name': 'h264'},
+                {
+                    'index': 2,
+                    'codec_type': 'subtitle',
+                    'codec_name': 'ass',
+                    'tags': {'language': 'eng', 'title': 'Full'},
+                },
+                {
+                    'index': 3,
+                    'codec_type': 'subtitle',
+                    'codec_name': 'hdmv_pgs_subtitle',
+                    'disposition': {'forced': 1},
+                },
+            ]
+        }
+
+        tracks = SubtitleExtractor()._convert_ffprobe_info(info)['tracks']
+
+        assert [(t['id'], t['subtitle_index'], t['codec']) for t in tracks] == [
+            (2, 0, 'ass'),
+            (3, 1, 'hdmv_pgs_subtitle'),
+        ]
+        assert tracks[0]['properties'] == {
+            'language': 'eng',
+            'track_name': 'Full',
+            'codec_id': 'ass',
+            'forced_track': False,
+        }
+        assert tracks[1]['properties']['language'] == 'und'
+        assert tracks[1]['properties']['forced_track'] is True
+
+    @pytest.mark.parametrize(
+        'codec, ext',
+        [
+            ('ass', '.ass'),
+            ('SSA', '.ssa'),
+            ('webvtt', '.vtt'),
+            ('subrip', '.srt'),
+            ('mov_text', '.srt'),
+            ('', '.srt'),
+        ],
+    )
+    def test_get_subtitle_extension(self, codec, ext):
+        assert SubtitleExtractor().get_subtitle_extension({'codec': codec}) == ext
+
+    @pytest.mark.parametrize(
+        'codec, image',
+        [
+            ('hdmv_pgs_subtitle', True),
+            ('DVD_SUBTITLE', True),
+            ('dvb_subtitle', True),
+            ('ass', False),
+            ('subrip', False),
+            ('', False),
+        ],
+    )
+    def test_is_image_track(self, codec, image):
+        assert is_image_track({'codec': codec}) is image
+
     def test_find_english_track(self, create_test_mkv):
         mkv_file = create_test_mkv(language='eng', track_name='English')
         extractor = SubtitleExtractor()
@@ -279,3 +397,54 @@ class TestSubtitleExtractorErrors:
 
         with pytest.raises(SubtitleExtractionError, match='Failed to extract'):
             extractor.extract_subtitle(mkv_file, 999, output_path, subtitle_index=999)
+
+
+class TestExtractSubtitlesBatch:
+    def test_single_ffmpeg_pass_for_all_tracks(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.touch()
+        en, pl = tmp_path / 'ep01.en.ass', tmp_path / 'ep01.pl.srt'
+
+        with (
+            patch('movie_translator.subtitles.extractor.get_ffmpeg', return_value='ffmpeg'),
+            patch(
+                'movie_translator.subtitles.extractor.subprocess.run',
+                return_value=MagicMock(returncode=0),
+            ) as run,
+        ):
+            SubtitleExtractor().extract_subtitles(video, [(0, en), (2, pl)])
+
+        run.assert_called_once()
+        cmd = run.call_args.args[0]
+        assert cmd[:4] == ['ffmpeg', '-y', '-i', str(video)]
+        assert cmd[4:] == [
+            *('-map', '0:s:0', '-c:s', 'copy', str(en)),
+            *('-map', '0:s:2', '-c:s', 'copy', str(pl)),
+        ]
+
+    def test_raises_on_ffmpeg_failure(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.touch()
+        failed = MagicMock(returncode=1, stderr='Invalid stream specifier')
+
+        with (
+            patch('movie_translator.subtitles.extractor.get_ffmpeg', return_value='ffmpeg'),
+            patch('movie_translator.subtitles.extractor.subprocess.run', return_value=failed),
+        ):
+            with pytest.raises(SubtitleExtractionError, match='Invalid stream specifier'):
+                SubtitleExtractor().extract_subtitles(video, [(5, tmp_path / 'x.ass')])
+
+    def test_failure_message_keeps_only_error_lines(self, tmp_path):
+        video = tmp_path / 'ep01.mkv'
+        video.touch()
+        stderr = 'ffmpeg version 7.1\nInput #0, matroska\n[out#0] Invalid argument\nERROR: bad\n'
+        failed = MagicMock(returncode=1, stderr=stderr)
+
+        with (
+            patch('movie_translator.subtitles.extractor.get_ffmpeg', return_value='ffmpeg'),
+            patch('movie_translator.subtitles.extractor.subprocess.run', return_value=failed),
+        ):
+            with pytest.raises(SubtitleExtractionError) as exc_info:
+                SubtitleExtractor().extract_subtitles(video, [(0, tmp_path / 'x.ass')])
+
+        assert str(exc_info.value).endswith(': [out#0] Invalid argument; ERROR: bad')
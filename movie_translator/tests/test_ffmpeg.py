@@ -1,5 +1,7 @@
+import os
 import subprocess
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -43,6 +45,25 @@ def test_get_video_info_raises_on_nonexistent_file():
         get_video_info(Path('/nonexistent/file.mkv'))
 
 
+def test_get_video_info_memoized_until_file_changes(tmp_path):
+    video = tmp_path / 'ep01.mkv'
+    video.write_bytes(b'video')
+    probe = MagicMock(return_value=MagicMock(stdout=b'{"streams": []}'))
+
+    with (
+        patch('movie_translator.ffmpeg.get_ffprobe', return_value='ffprobe'),
+        patch('movie_translator.ffmpeg.subprocess.run', probe),
+    ):
+        get_video_info(video)
+        get_video_info(video)
+        assert probe.call_count == 1
+
+        st = video.stat()
+        os.utime(video, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        get_video_info(video)
+        assert probe.call_count == 2
+
+
 @pytest.fixture
 def sample_video(tmp_path):
     """Create a short test video with known properties."""
@@ -45,6 +45,30 @@ def test_get_embedded_fonts_no_fonts(create_test_mkv):
     assert fonts == []
 
 
+def test_get_embedded_fonts_reads_attachments_from_shared_probe(tmp_path):
+    info = {
+        'streams': [
+            {'index': 0, 'codec_type': 'video'},
+            {
+                'index': 3,
+                'codec_type': 'attachment',
+                'tags': {'filename': 'Roboto.ttf', 'mimetype': 'font/ttf'},
+            },
+            {
+                'index': 4,
+                'codec_type': 'attachment',
+                'tags': {'filename': 'cover.jpg', 'mimetype': 'image/jpeg'},
+            },
+        ]
+    }
+
+    with patch('movie_translator.fonts.get_video_info', return_value=info) as probe:
+        fonts = get_embedded_fonts(tmp_path / 'ep01.mkv')
+
+    probe.assert_called_once_with(tmp_path / 'ep01.mkv')
+    assert fonts == [{'index': 3, 'filename': 'Roboto.ttf', 'mimetype': 'font/ttf'}]
+
+
 def test_font_supports_polish_nonexistent_file():
     result = font_supports_polish(Path('/nonexistent/font.ttf'))
     assert result is False
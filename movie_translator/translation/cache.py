@@ -0,0 +1,64 @@
+"""On-disk cache for translated dialogue.
+
+Translating an episode is the most expensive step of a run after OCR, yet
+its output only depends on the English lines, the backend and the names
+protected from translation. Entries are keyed by a hash of exactly those
+inputs, so re-running on a file whose mux failed, or on another release of
+the same episode with identical subtitles, skips model loading and inference.
+
+Bump _CACHE_VERSION when pre/post-processing changes what a translation
+looks like. Cache failures are never fatal — they only cost a re-translation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from ..cache import cache_dir
+from ..logging import logger
+
+_CACHE_VERSION = 1
+
+
+def _entry_path(texts: list[str], model: str, device: str, proper_nouns: set[str]) -> Path | None:
+    root = cache_dir('translations')
+    if root is None:
+        return None
+    key = json.dumps([_CACHE_VERSION, model, device, sorted(proper_nouns), texts])
+    return root / f'{hashlib.sha1(key.encode()).hexdigest()}.json'
+
+
+def load_translation(
+    texts: list[str], model: str, device: str, proper_nouns: set[str]
+) -> list[str] | None:
+    """Return the cached translation of *texts*, or None on a miss."""
+    path = _entry_path(texts, model, device, proper_nouns)
+    if path is None:
+        return None
+    try:
+        translated = json.loads(path.read_text(encoding='utf-8'))
+    except OSError, ValueError:
+        return None
+    if not isinstance(translated, list) or len(translated) != len(texts):
+        return None
+    logger.info(f'Reusing cached translation of {len(texts)} lines')
+    return translated
+
+
+def store_translation(
+    texts: list[str], model: str, device: str, proper_nouns: set[str], translated: list[str]
+) -> None:
+    """Save a translation of *texts* for later runs."""
+    path = _entry_path(texts, model, device, proper_nouns)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(translated, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f'Translation cache write failed: {e}')
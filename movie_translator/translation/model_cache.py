@@ -51,7 +51,13 @@ class ModelCache:
         if self._translator is not None:
             self._translator.cleanup()
 
-        translator = SubtitleTranslator(device=device, batch_size=batch_size, model_key=model)
+        translator = SubtitleTranslator(
+            device=device,
+            batch_size=batch_size,
+            model_key=model,
+            sort_by_length=True,
+            auto_batch=True,
+        )
         if not translator.load_model():
             return None, False
         self._translator = translator
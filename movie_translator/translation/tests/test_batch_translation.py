@@ -138,6 +138,103 @@ class TestBatchTranslation:
         assert len(result) == 8
         assert result == expected
 
+    def test_sort_by_length_groups_batches_and_keeps_order(self):
+        texts = ['- A much longer line here.', '- Hi.', '- Medium line.', '- Yo.']
+
+        translator = SubtitleTranslator(
+            model_key='allegro',
+            device='cpu',
+            batch_size=2,
+            enable_enhancements=False,
+            sort_by_length=True,
+        )
+        translator.tokenizer = MagicMock()
+        translator.model = MagicMock()
+
+        batches = []
+
+        def mock_encode(texts_list, **kwargs):
+            # Drop the BiDi target-language prefix the allegro model adds
+            batches.append([t.removeprefix('>>pol<< ') for t in texts_list])
+            return {'input_ids': MagicMock(), 'attention_mask': MagicMock()}
+
+        def mock_decode(outputs, **kwargs):
+            return [f'PL {text}' for text in batches[-1]]
+
+        translator.tokenizer.batch_encode_plus.side_effect = mock_encode
+        translator.model.generate.return_value = MagicMock()
+        translator.tokenizer.batch_decode.side_effect = mock_decode
+
+        result = translator.translate_texts(texts)
+
+        # The two short lines share a batch instead of padding to the long one
+        assert batches == [['- Hi.', '- Yo.'], ['- Medium line.', '- A much longer line here.']]
+        assert result == [f'PL {text}' for text in texts]
+
+    def test_auto_batch_sizes_batches_by_length(self):
+        short = [f'- Hi {i}.' for i in range(4)]
+        long = [f'- This is a considerably longer line of dialogue number {i}.' for i in range(4)]
+        texts = short[:2] + long + short[2:]
+
+        translator = SubtitleTranslator(
+            model_key='allegro',
+            device='cpu',
+            batch_size=2,
+            enable_enhancements=False,
+            auto_batch=True,
+        )
+        translator.tokenizer = MagicMock()
+        translator.model = MagicMock()
+
+        batches = []
+
+        def mock_encode(texts_list, **kwargs):
+            batches.append([t.removeprefix('>>pol<< ') for t in texts_list])
+            return {'input_ids': MagicMock(), 'attention_mask': MagicMock()}
+
+        def mock_decode(outputs, **kwargs):
+            return [f'PL {text}' for text in batches[-1]]
+
+        translator.tokenizer.batch_encode_plus.side_effect = mock_encode
+        translator.model.generate.return_value = MagicMock()
+        translator.tokenizer.batch_decode.side_effect = mock_decode
+
+        result = translator.translate_texts(texts)
+
+        # Lines shorter than the median share a bigger batch
+        assert [len(b) for b in batches] == [4, 2, 2]
+        assert batches[0] == short
+        assert result == [f'PL {text}' for text in texts]
+
+    def test_repeated_units_are_translated_once(self):
+        texts = ['- Yes.', '- Where are you going?', '- Yes.', '- No.', '- Yes.']
+
+        translator = SubtitleTranslator(
+            model_key='allegro', device='cpu', batch_size=10, enable_enhancements=False
+        )
+        translator.tokenizer = MagicMock()
+        translator.model = MagicMock()
+
+        batches = []
+
+        def mock_encode(texts_list, **kwargs):
+            batches.append([t.removeprefix('>>pol<< ') for t in texts_list])
+            return {'input_ids': MagicMock(), 'attention_mask': MagicMock()}
+
+        def mock_decode(outputs, **kwargs):
+            return [f'PL {text}' for text in batches[-1]]
+
+        translator.tokenizer.batch_encode_plus.side_effect = mock_encode
+        translator.model.generate.return_value = MagicMock()
+        translator.tokenizer.batch_decode.side_effect = mock_decode
+        progress = MagicMock()
+
+        result = translator.translate_texts(texts, progress_callback=progress)
+
+        assert batches == [['- Yes.', '- Where are you going?', '- No.']]
+        assert result == [f'PL {text}' for text in texts]
+        assert progress.call_args.args[:2] == (5, 5)
+
     def test_translation_single_line_edge_case(self):
         texts = ['Single line.']
 
@@ -1,10 +1,11 @@
 """Tests for SubtitleTranslator."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import torch
 
-from movie_translator.translation.translator import SubtitleTranslator
+from movie_translator.translation.translator import SubtitleTranslator, translate_dialogue_lines
+from movie_translator.types import DialogueLine
 
 
 class TestPreprocessTexts:
@@ -85,3 +86,66 @@ class TestNllbIntegration:
 
         call_kwargs = mock_model.generate.call_args[1]
         assert 'forced_bos_token_id' not in call_kwargs
+
+
+class TestSharedTranslatorAcrossFiles:
+    def test_proper_nouns_do_not_carry_over_to_next_file(self):
+        translator = MagicMock()
+        translator.translate_texts.return_value = ['Cześć']
+        cache = MagicMock()
+        cache.get_translator.return_value = (translator, True)
+        lines = [DialogueLine(0, 1000, 'Hello')]
+
+        translate_dialogue_lines(
+            lines, 'cpu', 16, 'allegro', model_cache=cache, proper_nouns={'Guts'}
+        )
+        assert translator.proper_nouns == {'Guts'}
+
+        translate_dialogue_lines(lines, 'cpu', 16, 'allegro', model_cache=cache)
+        assert translator.proper_nouns == set()
+
+
+class TestTranslationCache:
+    def _cache_with(self, translator):
+        cache = MagicMock()
+        cache.get_translator.return_value = (translator, True)
+        return cache
+
+    def test_repeat_run_reuses_translation(self):
+        translator = MagicMock()
+        translator.translate_texts.return_value = ['Cześć']
+        lines = [DialogueLine(0, 1000, 'Hello')]
+
+        translate_dialogue_lines(
+            lines, 'cpu', 16, 'allegro', model_cache=self._cache_with(translator)
+        )
+        other = self._cache_with(MagicMock())
+        result = translate_dialogue_lines(lines, 'cpu', 16, 'allegro', model_cache=other)
+
+        other.get_translator.assert_not_called()
+        assert result == [DialogueLine(0, 1000, 'Cześć')]
+
+    def test_different_model_misses(self):
+        translator = MagicMock()
+        translator.translate_texts.return_value = ['Cześć']
+        lines = [DialogueLine(0, 1000, 'Hello')]
+
+        translate_dialogue_lines(
+            lines, 'cpu', 16, 'allegro', model_cache=self._cache_with(translator)
+        )
+        other = self._cache_with(translator)
+        translate_dialogue_lines(lines, 'cpu', 16, 'nllb', model_cache=other)
+
+        other.get_translator.assert_called_once()
+
+    def test_disabled_cache_always_translates(self):
+        translator = MagicMock()
+        translator.translate_texts.return_value = ['Cześć']
+        cache = self._cache_with(translator)
+        lines = [DialogueLine(0, 1000, 'Hello')]
+
+        with patch('movie_translator.cache._enabled', False):
+            translate_dialogue_lines(lines, 'cpu', 16, 'allegro', model_cache=cache)
+            translate_dialogue_lines(lines, 'cpu', 16, 'allegro', model_cache=cache)
+
+        assert translator.translate_texts.call_count == 2
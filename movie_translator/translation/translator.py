@@ -9,6 +9,7 @@ from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 from ..logging import logger
 from ..metrics.collector import MetricsCollector, NullCollector
 from ..types import DialogueLine, ProgressCallback
+from .cache import load_translation, store_translation
 from .enhancements import (
     PreprocessingStats,
     extract_placeholders,
@@ -42,6 +43,8 @@ class SubtitleTranslator:
         device: str = DEFAULT_DEVICE,
         batch_size: int = DEFAULT_BATCH_SIZE,
         enable_enhancements: bool = True,
+        sort_by_length: bool = False,
+        auto_batch: bool = False,
     ):
         self.model_key = model_key
         self.model_config = self._get_model_config(model_key)
@@ -49,6 +52,12 @@ class SubtitleTranslator:
         self.device = 'mps' if device == 'mps' else 'cpu'
         self.batch_size = batch_size
         self.enable_enhancements = enable_enhancements
+        # Batch similar-length units together so padding to the longest
+        # sequence in a batch wastes less compute; results are scattered back.
+        self.sort_by_length = sort_by_length
+        # With sorted units, size each batch by length instead of count: many
+        # short lines per batch, few long ones, at roughly constant padded size.
+        self.auto_batch = auto_batch
         self.preprocessing_stats = PreprocessingStats()
         self.proper_nouns: set[str] = set()
         self.tokenizer = None
@@ -120,27 +129,44 @@ class SubtitleTranslator:
             f'Sentence merging: {len(texts)} lines \u2192 {len(merged_texts)} translation units'
         )
 
-        translations = []
+        # Repeated units ("Yes.", "What?", a catchphrase) go through the model
+        # once; decoding is greedy, so every copy gets the same translation.
+        unique_ids: dict[str, int] = {}
+        unit_ids = [unique_ids.setdefault(text, len(unique_ids)) for text in merged_texts]
+        unique_texts = list(unique_ids)
+        unique_line_counts = [0] * len(unique_texts)
+        for unit, uid in enumerate(unit_ids):
+            unique_line_counts[uid] += len(groups[unit].line_indices)
+        if len(unique_texts) < len(merged_texts):
+            logger.debug(
+                f'Deduplicated {len(merged_texts) - len(unique_texts)} repeated translation units'
+            )
+
+        order = list(range(len(unique_texts)))
+        if self.sort_by_length or self.auto_batch:
+            order.sort(key=lambda idx: len(unique_texts[idx]))
+
+        unique_translations = [''] * len(unique_texts)
         total_lines = len(texts)
+        lines_done = 0
         start_time = time.time()
 
-        for i in range(0, len(merged_texts), self.batch_size):
-            batch_texts = merged_texts[i : i + self.batch_size]
-
-            batch_translations = self._translate_batch(batch_texts)
-            translations.extend(batch_translations)
+        for batch_no, batch_indices in enumerate(self._plan_batches(order, unique_texts)):
+            batch_translations = self._translate_batch([unique_texts[j] for j in batch_indices])
+            for j, translated in zip(batch_indices, batch_translations, strict=True):
+                unique_translations[j] = translated
 
             if progress_callback:
-                # Count original lines covered so far across all completed groups
-                units_done = min(i + self.batch_size, len(merged_texts))
-                lines_done = sum(len(g.line_indices) for g in groups[:units_done])
+                # Count original lines covered by the units in this batch
+                lines_done += sum(unique_line_counts[j] for j in batch_indices)
                 elapsed = time.time() - start_time
                 rate = lines_done / elapsed if elapsed > 0 else 0
                 progress_callback(lines_done, total_lines, rate)
 
-            self._periodic_memory_cleanup(i)
+            self._periodic_memory_cleanup(batch_no * self.batch_size)
 
         self._clear_memory()
+        translations = [unique_translations[uid] for uid in unit_ids]
 
         # Log preprocessing statistics if enhancements are enabled
         if self.enable_enhancements and self.preprocessing_stats.total_processed > 0:
@@ -149,6 +175,31 @@ class SubtitleTranslator:
         # Split merged translations back to original line count
         return unmerge_translations(translations, groups, texts)
 
+    def _plan_batches(self, order: list[int], texts: list[str]) -> list[list[int]]:
+        """Split *order* into batches of unit indices.
+
+        Fixed-size by default. With auto_batch, *order* is sorted by length
+        and each batch is filled while ``count * longest`` stays within the
+        padded size of a batch_size batch of median-length units, capped at
+        4x batch_size.
+        """
+        if not self.auto_batch:
+            return [order[i : i + self.batch_size] for i in range(0, len(order), self.batch_size)]
+
+        budget = self.batch_size * max(1, len(texts[order[len(order) // 2]]))
+        max_count = self.batch_size * 4
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        for idx in order:
+            longest = max(1, len(texts[idx]))
+            if batch and ((len(batch) + 1) * longest > budget or len(batch) >= max_count):
+                batches.append(batch)
+                batch = []
+            batch.append(idx)
+        if batch:
+            batches.append(batch)
+        return batches
+
     def _periodic_memory_cleanup(self, index: int):
         if index > 0 and index % (self.batch_size * 50) == 0:
             self._clear_memory()
@@ -345,24 +396,30 @@ def translate_dialogue_lines(
     if model_cache is None:
         model_cache = ModelCache()
 
-    if model == 'apple':
+    proper_nouns = proper_nouns or set()
+    texts = [line.text for line in dialogue_lines]
+    translated_texts = load_translation(texts, model, device, proper_nouns)
+    if translated_texts is not None:
+        if progress_callback is not None:
+            progress_callback(len(texts), len(texts), 0.0)
+    elif model == 'apple':
         backend = model_cache.get_apple_backend(batch_size)
         if backend is None:
             return []
-        if proper_nouns:
-            backend.proper_nouns = proper_nouns
-        texts = [line.text for line in dialogue_lines]
+        # The backend is shared across files; don't let one file's names leak
+        # into the next.
+        backend.proper_nouns = proper_nouns
         translated_texts = backend.translate_texts(texts, progress_callback)
+        store_translation(texts, model, device, proper_nouns, translated_texts)
     else:
         with metrics.span('load_model') as s:
             translator, cached = model_cache.get_translator(device, batch_size, model)
             s.detail('cached', cached)
         if translator is None:
             return []
-        if proper_nouns:
-            translator.proper_nouns = proper_nouns
-        texts = [line.text for line in dialogue_lines]
+        translator.proper_nouns = proper_nouns
         translated_texts = translator.translate_texts(texts, progress_callback)
+        store_translation(texts, model, device, proper_nouns, translated_texts)
 
     return [
         DialogueLine(line.start_ms, line.end_ms, text)
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -10,6 +11,17 @@ ProgressCallback = Callable[[int, int, float], None]
 # romaji (OPRO/INRO) and English (OPEN/INEN) suffixes.
 NON_DIALOGUE_STYLES = ('sign', 'song', 'title', 'op', 'ed', 'insert', 'inro', 'inen')
 
+
+@lru_cache(maxsize=256)
+def is_non_dialogue_style(style: str) -> bool:
+    """Whether a style name contains any NON_DIALOGUE_STYLES keyword (case-insensitive).
+
+    Memoized: a track has a handful of styles but thousands of events.
+    """
+    style = style.lower()
+    return any(keyword in style for keyword in NON_DIALOGUE_STYLES)
+
+
 # Polish diacritical characters
 POLISH_CHARS = 'ąćęłńóśźżĄĆĘŁŃÓŚŹŻ'
 